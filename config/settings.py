@@ -33,15 +33,57 @@ LINE_THICKNESS = 2
 POINT_RADIUS = 5
 
 # Camera settings
-CAMERA_WIDTH = 1280
-CAMERA_HEIGHT = 720
+# Frames are captured and analyzed at the camera resolution; MediaPipe resizes
+# its input to 256x256 internally, so capturing larger frames only adds
+# per-pixel work. Output is upscaled to the display resolution for viewing.
+CAMERA_WIDTH = 640
+CAMERA_HEIGHT = 480
+DISPLAY_WIDTH = 1280
+DISPLAY_HEIGHT = 720
 DEFAULT_FPS = 30
 DEFAULT_MIRROR = True
 
 # MediaPipe Pose settings
-POSE_MODEL_COMPLEXITY = 2
+POSE_MODEL_COMPLEXITY = 1         # 0 = lite, 1 = full, 2 = heavy
 MIN_DETECTION_CONFIDENCE = 0.5
 MIN_TRACKING_CONFIDENCE = 0.5
+SIDE_CHECK_INTERVAL = 10          # frames between re-checks of the more visible body side
+
+# Motion gate: pose inference is skipped when the mean absolute difference of
+# small grayscale thumbnails against the last analyzed frame is below the threshold
+MOTION_GATE_SIZE = (80, 60)       # thumbnail (width, height)
+MOTION_GATE_THRESHOLD = 2.0       # mean gray-level difference (0-255)
+
+# Run pose inference only on every Nth frame and reuse the last results in between
+# (1 = every frame)
+POSE_DETECT_INTERVAL = 1
+
+# Scale applied to frames before pose inference (1.0 = full resolution); landmarks are
+# normalized, so they map back onto the full-resolution frame unchanged
+POSE_INPUT_SCALE = 1.0
+
+# Adaptive model complexity: drop to a lighter pose model while the smoothed inference
+# time exceeds the budget, and step back up (at most to the configured complexity)
+# once it has stayed well under budget for a while
+POSE_ADAPTIVE_COMPLEXITY = False
+POSE_LATENCY_TARGET_MS = 33.0     # per-frame inference budget
+POSE_UPGRADE_FRAMES = 150         # frames under half the budget before upgrading
+
+# One Euro smoothing of landmark pixel coordinates, suppressing jitter
+LANDMARK_FILTER_ENABLED = False
+LANDMARK_FILTER_MIN_CUTOFF = 1.0  # Hz; lower smooths more at rest
+LANDMARK_FILTER_BETA = 0.007      # higher reduces lag during fast movement
+
+# Run pose inference in a separate process, passing frames through shared memory
+POSE_INFERENCE_PROCESS = False
+
+# Optional MediaPipe Tasks pose landmarker, which can run on the GPU delegate.
+# Set to a directory holding pose_landmarker_lite/full/heavy.task to enable it
+POSE_TASK_MODEL_DIR = None
+POSE_TASK_USE_GPU = True          # falls back to the CPU delegate if the GPU is unavailable
+# Path of a specific .task bundle (e.g. a quantized model) to load instead; it also
+# enables the Tasks backend and fixes the model, so complexity changes are ignored
+POSE_TASK_MODEL_PATH = None
 
 # GUI settings
 GUI_SETTINGS = {
@@ -1,9 +1,16 @@
 import json
-import os
-from typing import Dict, Any, Callable, List
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, FrozenSet, Optional, Tuple
 from bike_fit_analyzer.config.settings import *
 from bike_fit_analyzer.config.settings import CAMERA_HEIGHT, CAMERA_WIDTH, DEFAULT_MIRROR, IDEAL_ANGLES, MIN_DETECTION_CONFIDENCE, MIN_TRACKING_CONFIDENCE, POSE_MODEL_COMPLEXITY
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
 class SettingsManager:
     """Central manager for all application settings."""
     
@@ -53,8 +60,33 @@ class SettingsManager:
             "enable_geometry": True
         }
         
-        # Store observers that need to be notified of changes
-        self.observers: List[Callable[[str, Any], None]] = []
+        # Store observers that need to be notified of changes: global observers see
+        # every change, keyed observers only changes to the setting they registered for.
+        # The collections are immutable tuples replaced on add/remove, so notification
+        # can iterate them directly even if an observer (un)registers during the call
+        self._observers: Tuple[Callable[[str, Any], None], ...] = ()
+        self._by_key: Dict[str, Tuple[Callable[[str, Any], None], ...]] = {}
+        
+        # Batched notifications: nesting depth and the latest pending value per key
+        self._batch_depth = 0
+        self._pending: Dict[str, Any] = {}
+        
+        # Known setting names, exposed as attributes (e.g. settings_manager.show_skeleton)
+        self._keys: FrozenSet[str] = frozenset(self.settings)
+    
+    def __getattr__(self, name: str) -> Any:
+        """Read a setting as an attribute; only called when normal lookup fails."""
+        settings = self.__dict__.get("settings")
+        if settings is not None and name in settings:
+            return settings[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Route assignments to known settings through set() so observers are notified."""
+        if name in self.__dict__.get("_keys", ()):
+            self.set(name, value)
+        else:
+            object.__setattr__(self, name, value)
     
     def get(self, key: str, default=None) -> Any:
         """Get a setting value."""
@@ -66,19 +98,62 @@ class SettingsManager:
             self.settings[key] = value
             self._notify_observers(key, value)
     
-    def add_observer(self, observer: Callable[[str, Any], None]) -> None:
-        """Add an observer to be notified of setting changes."""
-        if observer not in self.observers:
-            self.observers.append(observer)
+    def add_observer(self, key: str, observer: Callable[[str, Any], None]) -> None:
+        """Add an observer to be notified of changes to a single setting."""
+        observers = self._by_key.get(key, ())
+        if observer not in observers:
+            self._by_key[key] = observers + (observer,)
+    
+    def add_global_observer(self, observer: Callable[[str, Any], None]) -> None:
+        """Add an observer to be notified of all setting changes."""
+        if observer not in self._observers:
+            self._observers = self._observers + (observer,)
+    
+    def remove_observer(self, observer: Callable[[str, Any], None], key: Optional[str] = None) -> None:
+        """Remove an observer, from one setting's observers or from all of them."""
+        if key is None:
+            self._observers = tuple(o for o in self._observers if o != observer)
+            keys = list(self._by_key)
+        else:
+            keys = [key] if key in self._by_key else []
+        
+        for k in keys:
+            self._by_key[k] = tuple(o for o in self._by_key[k] if o != observer)
+    
+    def begin_batch(self) -> None:
+        """Start buffering change notifications until the matching end_batch()."""
+        self._batch_depth += 1
     
-    def remove_observer(self, observer: Callable[[str, Any], None]) -> None:
-        """Remove an observer."""
-        if observer in self.observers:
-            self.observers.remove(observer)
+    def end_batch(self) -> None:
+        """Finish a batch and notify observers once per changed setting."""
+        self._batch_depth -= 1
+        if self._batch_depth > 0 or not self._pending:
+            return
+        
+        pending, self._pending = self._pending, {}
+        for key, value in pending.items():
+            self._notify_observers(key, value)
+    
+    @contextmanager
+    def batch(self):
+        """Context manager that batches change notifications."""
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
     
     def _notify_observers(self, key: str, value: Any) -> None:
-        """Notify all observers of a setting change."""
-        for observer in self.observers:
+        """Notify the observers of the changed setting and all global observers."""
+        if self._batch_depth:
+            # Keep only the last value of each setting changed during the batch
+            self._pending.pop(key, None)
+            self._pending[key] = value
+            return
+        
+        for observer in self._by_key.get(key, ()):
+            observer(key, value)
+        for observer in self._observers:
             observer(key, value)
     
     def save_to_file(self, file_path: str) -> None:
@@ -88,22 +163,26 @@ class SettingsManager:
     
     def load_from_file(self, file_path: str) -> bool:
         """Load settings from a JSON file."""
-        if not os.path.exists(file_path):
+        # ValueError covers malformed JSON and non-UTF-8 files from both parsers
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            new_settings = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+        except (OSError, ValueError) as e:
+            print(f"Error loading settings from {file_path}: {e}")
             return False
         
-        try:
-            with open(file_path, 'r') as f:
-                new_settings = json.load(f)
-                
-                # Update settings and notify observers
-                for key, value in new_settings.items():
-                    if key in self.settings:
-                        self.set(key, value)
-                
-                return True
-        except Exception as e:
-            print(f"Error loading settings: {e}")
+        if not isinstance(new_settings, dict):
+            print(f"Error loading settings from {file_path}: expected a JSON object")
             return False
+        
+        # Update settings and notify observers once all values are applied
+        with self.batch():
+            for key, value in new_settings.items():
+                if key in self.settings:
+                    self.set(key, value)
+        
+        return True
 
 # Create a global instance
 settings_manager = SettingsManager()
\ No newline at end of file
@@ -2,46 +2,121 @@
 Core analyzer functionality for the Bike Fit Analyzer.
 """
 import cv2
-from typing import Optional, Tuple
+import queue
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, FrozenSet, Optional, Tuple
 
 from bike_fit_analyzer.core.pose_detector import PoseDetector
 from bike_fit_analyzer.utils.camera import CameraManager
 from bike_fit_analyzer.utils.visualization import Visualizer
 from bike_fit_analyzer.ui.renderer import UIRenderer
 from bike_fit_analyzer.guidance.bike_adjustments import BikeAdjustmentAnalyzer
+from bike_fit_analyzer.models.angles import PoseData
+from bike_fit_analyzer.config.settings_manager import settings_manager
+
+# Settings mirrored into the analyzer's per-frame visualization snapshot
+VISUALIZATION_SETTINGS = frozenset((
+    "show_skeleton",
+    "show_landmarks",
+    "show_angles",
+    "show_guidance",
+    "view_mode"
+))
 
 
 class BikeFitAnalyzer:
     """Main class for the Bike Fit Analyzer application."""
     
-    def __init__(self):
-        """Initialize the Bike Fit Analyzer."""
+    def __init__(self, model_complexity: Optional[int] = None):
+        """
+        Initialize the Bike Fit Analyzer.
+        
+        Args:
+            model_complexity: Optional pose model complexity (defaults to POSE_MODEL_COMPLEXITY)
+        """
         self.camera_manager = CameraManager()
-        self.pose_detector = PoseDetector()
+        # process_frame already owns the caller's frame (it mirrors it in place), so
+        # landmarks can be drawn onto it without an extra full-frame copy
+        if model_complexity is None:
+            self.pose_detector = PoseDetector(in_place_draw=True)
+        else:
+            self.pose_detector = PoseDetector(model_complexity, in_place_draw=True)
         self.visualizer = Visualizer()
         self.ui_renderer = UIRenderer()
         self.bike_adjustment_analyzer = BikeAdjustmentAnalyzer()
+        
+        # Snapshot of the visualization settings, read once and kept current by the
+        # settings observer so the per-frame path only does attribute reads
+        self._vis_cfg = SimpleNamespace(**{key: settings_manager.get(key) for key in VISUALIZATION_SETTINGS})
+        for key in VISUALIZATION_SETTINGS:
+            settings_manager.add_observer(key, self._on_visualization_setting_changed)
+        
+        # Names of the enabled angles, rebuilt only when the setting changes
+        self._enabled_angles = self._enabled_angle_set(settings_manager.get("angles_enabled", {}))
+        settings_manager.add_observer("angles_enabled", self._on_angles_enabled_changed)
+    
+    def _on_visualization_setting_changed(self, key: str, value: Any) -> None:
+        """Keep the visualization settings snapshot up to date."""
+        setattr(self._vis_cfg, key, value)
+    
+    def _on_angles_enabled_changed(self, key: str, value: Dict[str, bool]) -> None:
+        """Rebuild the enabled angle set."""
+        self._enabled_angles = self._enabled_angle_set(value)
     
-    def process_frame(self, frame, mirror=False, view_mode="Normal View", show_angles=True, show_guidance=True):
+    @staticmethod
+    def _enabled_angle_set(angles_enabled: Dict[str, bool]) -> Optional[FrozenSet[str]]:
+        """
+        Build the set of enabled angle names.
+        
+        Returns:
+            Frozenset of enabled angle names, or None if every angle is enabled
+        """
+        if all(angles_enabled.values()):
+            return None
+        return frozenset(name for name, enabled in angles_enabled.items() if enabled)
+    
+    def process_frame(self, frame, mirror=False, view_mode=None, show_angles=None, show_guidance=None,
+                      show_landmarks=None):
         """
         Process a single frame.
         
         Args:
-            frame: Input frame
+            frame: Input frame (mirrored and drawn on in place)
             mirror: Whether to mirror the frame
-            view_mode: Visualization view mode
-            show_angles: Whether to show angles
-            show_guidance: Whether to show guidance
+            view_mode: Visualization view mode (defaults to the view_mode setting)
+            show_angles: Whether to show angles (defaults to the show_angles setting)
+            show_guidance: Whether to show guidance (defaults to the show_guidance setting)
+            show_landmarks: Whether to draw the landmark overlay (defaults to the show_landmarks setting)
             
         Returns:
             Tuple of (processed frame, pose data, adjustments)
         """
-        # Mirror the image if requested
+        vis_cfg = self._vis_cfg
+        if view_mode is None:
+            view_mode = vis_cfg.view_mode
+        if show_angles is None:
+            show_angles = vis_cfg.show_angles
+        if show_guidance is None:
+            show_guidance = vis_cfg.show_guidance
+        if show_landmarks is None:
+            show_landmarks = vis_cfg.show_landmarks
+        
+        # Mirror the image in place if requested (the caller's frame is overwritten)
         if mirror:
-            frame = cv2.flip(frame, 1)
+            cv2.flip(frame, 1, dst=frame)
+        
+        # Detect pose (the landmark overlay is skipped when it is switched off)
+        processed_frame, pose_data = self.pose_detector.detect_pose(frame, draw_viz=show_landmarks)
         
-        # Detect pose
-        processed_frame, pose_data = self.pose_detector.detect_pose(frame)
+        # Drop disabled angles (a single set lookup per angle, skipped when all are enabled)
+        enabled = self._enabled_angles
+        if pose_data is not None and enabled is not None:
+            pose_data = PoseData(
+                landmarks=pose_data.landmarks,
+                angles={name: angle for name, angle in pose_data.angles.items() if name in enabled},
+                landmarks_xy=pose_data.landmarks_xy
+            )
         
         # Generate adjustments if pose detected and guidance enabled
         adjustments = None
@@ -79,10 +154,13 @@ class BikeFitAnalyzer:
         show_angles = True
         show_guidance = True
         
+        # Capture frames in a background thread so camera latency overlaps pose inference
+        reader = self._start_reader(cap)
+        
         try:
             while True:
-                ret, frame = cap.read()
-                if not ret:
+                frame = reader[1].get()
+                if frame is None:
                     print("Failed to receive frame from camera.")
                     break
                 
@@ -125,8 +203,14 @@ class BikeFitAnalyzer:
                     current_idx = (current_idx + 1) % len(view_modes)
                     current_view_mode = view_modes[current_idx]
                     print(f"View mode: {current_view_mode}")
+                elif key in (ord('+'), ord('='), ord('-')):
+                    # Trade pose accuracy for speed
+                    step = -1 if key == ord('-') else 1
+                    self.pose_detector.set_model_complexity(self.pose_detector.model_complexity + step)
+                    print(f"Model complexity: {self.pose_detector.model_complexity}")
                 elif key == ord('c'):
                     # Clean up current camera
+                    self._stop_reader(reader)
                     cap.release()
                     
                     # Select a new camera
@@ -140,9 +224,78 @@ class BikeFitAnalyzer:
                     else:
                         camera_id = new_camera_id
                         print(f"Switched to camera {camera_id}")
+                    
+                    if cap is None:
+                        break
+                    reader = self._start_reader(cap)
         
         finally:
             # Clean up
+            self._stop_reader(reader)
             if cap is not None:
                 cap.release()
-            self.ui_renderer.cleanup()
\ No newline at end of file
+            self.pose_detector.close()
+            self.ui_renderer.cleanup()
+    
+    def _start_reader(self, cap):
+        """
+        Start a background thread that reads camera frames into a bounded queue.
+        
+        Args:
+            cap: Opened camera capture
+            
+        Returns:
+            Tuple of (reader thread, frame queue, stop event)
+        """
+        frame_queue = queue.Queue(maxsize=2)
+        stop_event = threading.Event()
+        thread = threading.Thread(
+            target=self._read_frames,
+            args=(cap, frame_queue, stop_event),
+            daemon=True
+        )
+        thread.start()
+        return thread, frame_queue, stop_event
+    
+    def _stop_reader(self, reader):
+        """
+        Stop a reader thread started with _start_reader.
+        
+        Args:
+            reader: Tuple of (reader thread, frame queue, stop event)
+        """
+        thread, frame_queue, stop_event = reader
+        stop_event.set()
+        thread.join()
+    
+    @staticmethod
+    def _read_frames(cap, frame_queue, stop_event):
+        """
+        Read frames from the camera until stopped or the camera fails.
+        
+        When processing falls behind, the oldest queued frame is dropped so the
+        consumer always gets the freshest frames instead of a growing backlog.
+        None is queued when a read fails.
+        
+        Args:
+            cap: Opened camera capture
+            frame_queue: Queue receiving the captured frames
+            stop_event: Event signalling the thread to stop
+        """
+        while not stop_event.is_set():
+            ret, frame = cap.read()
+            item = frame if ret else None
+            
+            # Drop the oldest frame rather than blocking when the queue is full
+            while True:
+                try:
+                    frame_queue.put_nowait(item)
+                    break
+                except queue.Full:
+                    try:
+                        frame_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+            
+            if item is None:
+                return
\ No newline at end of file
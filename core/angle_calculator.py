@@ -1,9 +1,50 @@
 """
 Angle calculation utilities for the Bike Fit Analyzer.
 """
+import math
 import numpy as np
-from typing import Tuple
+from typing import Optional, Tuple
 from bike_fit_analyzer.models.angles import Point, Angle
+from bike_fit_analyzer.utils.jit import njit
+
+
+@njit(cache=True, fastmath=True)
+def _angle_deg(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> float:
+    """Calculate the angle at vertex (bx, by) in degrees from raw coordinates."""
+    radians = math.atan2(cy - by, cx - bx) - math.atan2(ay - by, ax - bx)
+    angle = math.fabs(math.degrees(radians))
+    
+    if angle > 180.0:
+        angle = 360.0 - angle
+        
+    return angle
+
+
+@njit(cache=True, fastmath=True)
+def angles_at_rows(points: np.ndarray, rows: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Calculate several angles straight from a landmark coordinate array.
+    
+    Compiled with numba this runs the whole batch as one native loop,
+    without gathering the point triples into a separate array first.
+    
+    Args:
+        points: Array of shape (M, 2) with landmark x, y coordinates
+        rows: Array of shape (N, 3) with the rows of each angle's first point,
+            vertex and third point
+        out: Array of N floats receiving the angles in degrees
+        
+    Returns:
+        The out array
+    """
+    for i in range(rows.shape[0]):
+        a, b, c = rows[i, 0], rows[i, 1], rows[i, 2]
+        out[i] = _angle_deg(
+            float(points[a, 0]), float(points[a, 1]),
+            float(points[b, 0]), float(points[b, 1]),
+            float(points[c, 0]), float(points[c, 1])
+        )
+    return out
 
 
 def calculate_angle(a: Point, b: Point, c: Point) -> float:
@@ -18,17 +59,48 @@ def calculate_angle(a: Point, b: Point, c: Point) -> float:
     Returns:
         The angle in degrees
     """
-    a_arr = np.array([a.x, a.y])
-    b_arr = np.array([b.x, b.y])
-    c_arr = np.array([c.x, c.y])
-    
-    radians = np.arctan2(c_arr[1] - b_arr[1], c_arr[0] - b_arr[0]) - np.arctan2(a_arr[1] - b_arr[1], a_arr[0] - b_arr[0])
-    angle = np.abs(radians * 180.0 / np.pi)
+    return _angle_deg(float(a.x), float(a.y), float(b.x), float(b.y), float(c.x), float(c.y))
+
+
+def compute_angles(points_abc: np.ndarray, ba: Optional[np.ndarray] = None,
+                   bc: Optional[np.ndarray] = None, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calculate several angles at once from an array of point triples.
     
-    if angle > 180.0:
-        angle = 360 - angle
+    Args:
+        points_abc: Array of shape (N, 3, 2) holding the first point,
+            vertex and third point of each angle
+        ba: Optional (N, 2) float work buffer, reused across calls
+        bc: Optional (N, 2) float work buffer, reused across calls
+        out: Optional (N,) float array receiving the angles
         
-    return angle
+    Returns:
+        Array of N angles in degrees
+    """
+    points = np.asarray(points_abc)
+    count = len(points)
+    if ba is None:
+        ba = np.empty((count, 2), dtype=np.float64)
+    if bc is None:
+        bc = np.empty((count, 2), dtype=np.float64)
+    if out is None:
+        out = np.empty(count, dtype=ba.dtype)
+    
+    np.subtract(points[:, 0], points[:, 1], out=ba)
+    np.subtract(points[:, 2], points[:, 1], out=bc)
+    
+    # The x columns of the work buffers double as scratch space, so no temporaries are allocated
+    np.arctan2(bc[:, 1], bc[:, 0], out=out)
+    np.arctan2(ba[:, 1], ba[:, 0], out=ba[:, 0])
+    np.subtract(out, ba[:, 0], out=out)
+    np.degrees(out, out=out)
+    np.abs(out, out=out)
+    
+    # Fold reflex angles back into the 0-180 range
+    np.subtract(360.0, out, out=bc[:, 0])
+    np.minimum(out, bc[:, 0], out=out)
+    
+    return out
 
 
 def create_angle(a: Point, b: Point, c: Point, angle_type: str) -> Angle:
@@ -46,3 +118,13 @@ def create_angle(a: Point, b: Point, c: Point, angle_type: str) -> Angle:
     """
     angle_value = calculate_angle(a, b, c)
     return Angle(value=angle_value, angle_type=angle_type, point_a=a, point_b=b, point_c=c)
+
+
+# Compile the kernels at import time so the first analyzed frame does not pay the JIT cost,
+# using the same argument types as PoseDetector (int32 pixels, intp rows, float32 output)
+_angle_deg(0.0, 1.0, 0.0, 0.0, 1.0, 0.0)
+angles_at_rows(
+    np.array([[0, 1], [0, 0], [1, 0]], dtype=np.int32),
+    np.array([[0, 1, 2]], dtype=np.intp),
+    np.empty(1, dtype=np.float32)
+)
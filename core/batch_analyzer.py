@@ -0,0 +1,120 @@
+"""
+Offline batch analysis of recorded videos for the Bike Fit Analyzer.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+
+from bike_fit_analyzer.models.angles import PoseData
+from bike_fit_analyzer.guidance.bike_adjustments import AdjustmentRecommendation
+
+
+@dataclass
+class FrameAnalysis:
+    """Analysis results for a single video frame."""
+    frame_index: int
+    pose_data: Optional[PoseData]
+    adjustments: Optional[List[AdjustmentRecommendation]] = None
+    kops: Optional[Tuple[float, str]] = None
+    saddle: Optional[Dict[str, float]] = None
+
+
+def _analyze_segment(video_path: str, start: int, end: int) -> List[FrameAnalysis]:
+    """
+    Analyze the frames [start, end) of a video.
+    
+    Runs in a worker process, so every analyzer (including the MediaPipe pose
+    graph, which cannot be shared across processes) is created here.
+    
+    Args:
+        video_path: Path to the video file
+        start: Index of the first frame to analyze
+        end: Index one past the last frame to analyze
+    
+    Returns:
+        List of per-frame analysis results
+    """
+    from bike_fit_analyzer.core.pose_detector import PoseDetector
+    from bike_fit_analyzer.core.kops_analyzer import KOPSAnalyzer
+    from bike_fit_analyzer.core.saddle_analyzer import SaddleAnalyzer
+    from bike_fit_analyzer.guidance.bike_adjustments import BikeAdjustmentAnalyzer
+    
+    # Parallelism comes from the worker processes, so keep OpenCV single-threaded
+    cv2.setNumThreads(1)
+    
+    pose_detector = PoseDetector()
+    kops_analyzer = KOPSAnalyzer()
+    saddle_analyzer = SaddleAnalyzer()
+    bike_adjustment_analyzer = BikeAdjustmentAnalyzer()
+    
+    results = []
+    cap = cv2.VideoCapture(video_path)
+    try:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+        for frame_index in range(start, end):
+            ret, frame = cap.read()
+            if not ret:
+                break
+            
+            _, pose_data = pose_detector.detect_pose(frame, draw_viz=False)
+            if pose_data is None:
+                results.append(FrameAnalysis(frame_index, None))
+                continue
+            
+            deviation, assessment, _ = kops_analyzer.analyze_kops(frame, pose_data, draw_viz=False)
+            measurements, _ = saddle_analyzer.calculate_setback(frame, pose_data, draw_viz=False)
+            results.append(FrameAnalysis(
+                frame_index,
+                pose_data,
+                adjustments=bike_adjustment_analyzer.analyze_pose(pose_data),
+                kops=(deviation, assessment),
+                saddle=measurements
+            ))
+    finally:
+        cap.release()
+        pose_detector.close()
+    
+    return results
+
+
+def batch_analyze(video_path: str, n_workers: Optional[int] = None) -> List[FrameAnalysis]:
+    """
+    Analyze every frame of a recorded video in parallel worker processes.
+    
+    The video is split into one contiguous segment per worker. Each process
+    holds its own pose model, so memory use grows with the worker count, and
+    pose tracking restarts at every segment boundary.
+    
+    Args:
+        video_path: Path to the video file
+        n_workers: Number of worker processes (defaults to the CPU count)
+    
+    Returns:
+        Per-frame analysis results in frame order
+    """
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise IOError(f"Could not open video {video_path}")
+    frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+    
+    if frame_count <= 0:
+        return []
+    
+    n_workers = max(1, min(n_workers or os.cpu_count() or 1, frame_count))
+    bounds = [frame_count * i // n_workers for i in range(n_workers + 1)]
+    
+    # Spawn rather than fork: MediaPipe is not fork-safe
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as executor:
+        segments = executor.map(
+            _analyze_segment,
+            [video_path] * n_workers,
+            bounds[:-1],
+            bounds[1:]
+        )
+        return [result for segment in segments for result in segment]
@@ -3,10 +3,25 @@ Analyzer for cycling shoe cleat positioning.
 """
 import cv2
 import numpy as np
+from math import hypot
 from typing import Dict, Tuple, Optional
 
 from bike_fit_analyzer.models.angles import PoseData
 
+# Drawing colors (BGR) and font, bound once instead of built per draw call
+_COLOR_YELLOW = (0, 255, 255)
+_COLOR_RED = (0, 0, 255)
+_COLOR_GREEN = (0, 255, 0)
+_COLOR_CYAN = (255, 255, 0)
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+# Text color for each cleat position assessment
+_ASSESS_COLOR = {
+    "Optimal cleat position": _COLOR_GREEN,
+    "Cleat position too far back": _COLOR_RED,
+    "Cleat position too far forward": _COLOR_RED
+}
+
 class CleatAnalyzer:
     """Analyzes cycling shoe cleat positioning."""
     
@@ -14,6 +29,9 @@ class CleatAnalyzer:
         """Initialize the cleat analyzer."""
         self.calibration_factor = 1.0  # Pixels to cm
         
+        # Visualization buffer reused across frames instead of copying into a new array
+        self._viz_buf: Optional[np.ndarray] = None
+        
     def detect_foot_points(self, frame, pose_data):
         """
         Detect foot and cleat points in the frame.
@@ -54,16 +72,13 @@ class CleatAnalyzer:
         points = self.detect_foot_points(frame, pose_data)
         
         # Calculate foot length
-        foot_length_pixels = np.linalg.norm(
-            np.array(points["toe"]) - np.array(points["heel"])
-        )
+        toe, heel, ball = points["toe"], points["heel"], points["ball_of_foot"]
+        foot_length_pixels = hypot(toe[0] - heel[0], toe[1] - heel[1])
         foot_length_cm = foot_length_pixels * self.calibration_factor
         
         # Calculate cleat position as percentage from heel
         # (ball of foot is typically at 60-70% of foot length from heel)
-        heel_to_ball_pixels = np.linalg.norm(
-            np.array(points["ball_of_foot"]) - np.array(points["heel"])
-        )
+        heel_to_ball_pixels = hypot(ball[0] - heel[0], ball[1] - heel[1])
         
         cleat_position_percent = (heel_to_ball_pixels / foot_length_pixels) * 100
         
@@ -89,35 +104,43 @@ class CleatAnalyzer:
         return (measurements, viz_frame)
     
     def create_visualization(self, frame, points, measurements):
-        """Create visualization showing cleat positioning."""
-        result = frame.copy()
+        """
+        Create visualization showing cleat positioning.
+        
+        The returned image is a buffer owned by the analyzer and is overwritten
+        by the next call.
+        """
+        if self._viz_buf is None or self._viz_buf.shape != frame.shape:
+            self._viz_buf = np.empty_like(frame)
+        np.copyto(self._viz_buf, frame)
+        result = self._viz_buf
         
         # Draw foot outline
         cv2.line(result, 
                  points["heel"], 
                  points["ankle"], 
-                 (0, 255, 255), 2)
+                 _COLOR_YELLOW, 2)
         
         cv2.line(result, 
                  points["ankle"], 
                  points["toe"], 
-                 (0, 255, 255), 2)
+                 _COLOR_YELLOW, 2)
         
         # Draw ball of foot (cleat position)
-        cv2.circle(result, points["ball_of_foot"], 8, (0, 0, 255), -1)
+        cv2.circle(result, points["ball_of_foot"], 8, _COLOR_RED, -1)
         
         # Add text showing cleat position
         cv2.putText(result, 
                     f"Cleat: {measurements['cleat_position_percent']:.1f}%", 
                     (points["ball_of_foot"][0] + 10, points["ball_of_foot"][1]), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
+                    _FONT, 0.7, _COLOR_CYAN, 2)
         
         # Add assessment
         cv2.putText(result, 
                     measurements["assessment"], 
                     (points["ankle"][0] - 50, points["ankle"][1] - 30), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, 
-                    (0, 255, 0) if "Optimal" in measurements["assessment"] else (0, 0, 255), 
+                    _FONT, 0.7, 
+                    _ASSESS_COLOR.get(measurements["assessment"], _COLOR_RED), 
                     2)
         
         return result
\ No newline at end of file
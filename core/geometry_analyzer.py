@@ -5,6 +5,12 @@ import cv2
 import numpy as np
 from typing import Dict, Tuple, Optional
 
+# Drawing colors (BGR) and font, bound once instead of built per draw call
+_COLOR_RED = (0, 0, 255)
+_COLOR_GREEN = (0, 255, 0)
+_COLOR_BLUE = (255, 0, 0)
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+
 class GeometryAnalyzer:
     """Analyzes bike geometry including stack and reach."""
     
@@ -12,6 +18,9 @@ class GeometryAnalyzer:
         """Initialize the geometry analyzer."""
         self.calibration_factor = 1.0  # Pixels to cm
         
+        # Visualization buffer reused across frames instead of copying into a new array
+        self._viz_buf: Optional[np.ndarray] = None
+        
     def detect_bike_points(self, frame):
         """
         Detect key points on the bike frame.
@@ -67,39 +76,47 @@ class GeometryAnalyzer:
         return (measurements, viz_frame)
     
     def create_visualization(self, frame, points, measurements):
-        """Create visualization showing stack and reach measurements."""
-        result = frame.copy()
+        """
+        Create visualization showing stack and reach measurements.
+        
+        The returned image is a buffer owned by the analyzer and is overwritten
+        by the next call.
+        """
+        if self._viz_buf is None or self._viz_buf.shape != frame.shape:
+            self._viz_buf = np.empty_like(frame)
+        np.copyto(self._viz_buf, frame)
+        result = self._viz_buf
         
         bb = points["bottom_bracket"]
         ht = points["head_tube_top"]
         
         # Draw bottom bracket point
-        cv2.circle(result, bb, 8, (0, 0, 255), -1)
+        cv2.circle(result, bb, 8, _COLOR_RED, -1)
         
         # Draw head tube top point
-        cv2.circle(result, ht, 8, (0, 0, 255), -1)
+        cv2.circle(result, ht, 8, _COLOR_RED, -1)
         
         # Draw stack line (vertical)
         cv2.line(result, 
                  (ht[0], bb[1]), 
                  (ht[0], ht[1]), 
-                 (0, 255, 0), 2)
+                 _COLOR_GREEN, 2)
         
         # Draw reach line (horizontal)
         cv2.line(result, 
                  (bb[0], bb[1]), 
                  (ht[0], bb[1]), 
-                 (255, 0, 0), 2)
+                 _COLOR_BLUE, 2)
         
         # Add text for measurements
         cv2.putText(result, 
                     f"Stack: {measurements['stack']:.1f} cm", 
                     (ht[0] + 10, (ht[1] + bb[1]) // 2), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+                    _FONT, 0.7, _COLOR_GREEN, 2)
         
         cv2.putText(result, 
                     f"Reach: {measurements['reach']:.1f} cm", 
                     ((bb[0] + ht[0]) // 2, bb[1] + 30), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 0), 2)
+                    _FONT, 0.7, _COLOR_BLUE, 2)
         
         return result
\ No newline at end of file
@@ -10,11 +10,35 @@ from bike_fit_analyzer.models.angles import PoseData
 class KOPSAnalyzer:
     """Analyzes knee position relative to the pedal spindle."""
     
-    def __init__(self):
-        """Initialize the KOPS analyzer."""
+    def __init__(self, in_place_draw: bool = False):
+        """
+        Initialize the KOPS analyzer.
+        
+        Args:
+            in_place_draw: Draw the visualization directly onto the input frame instead
+                of a copy, for callers that do not need the undecorated frame afterwards
+        """
+        self.in_place_draw = in_place_draw
+        
         # Default tolerance in pixels
         self.tolerance = 20
         
+        # Pixel to cm conversion (would come from calibration)
+        self.pixels_per_cm = 10
+        
+        # Assessment messages indexed by the deviation's sign beyond the 1 cm tolerance,
+        # and the last assessment, reused while the deviation does not change
+        self._assessment_templates = (
+            "Knee is {:.1f} cm behind pedal spindle",
+            "Good KOPS alignment",
+            "Knee is {:.1f} cm ahead of pedal spindle"
+        )
+        self._last_deviation_pixels = None
+        self._last_assessment = ""
+        
+        # Visualization buffer reused across frames instead of copying into a new array
+        self._viz_buf: Optional[np.ndarray] = None
+        
     def detect_pedal_spindle(self, frame, knee_position):
         """
         Detect the pedal spindle position when crank is horizontal.
@@ -28,16 +52,17 @@ class KOPSAnalyzer:
         # Return estimated pedal spindle position
         return (knee_position[0], knee_position[1] + 100)  # Just an example
         
-    def analyze_kops(self, frame, pose_data) -> Tuple[float, str, Optional[np.ndarray]]:
+    def analyze_kops(self, frame, pose_data, draw_viz: bool = True) -> Tuple[float, str, Optional[np.ndarray]]:
         """
         Analyze the KOPS alignment.
         
         Args:
             frame: Input frame
             pose_data: Processed pose data
+            draw_viz: Whether to render the visualization frame
             
         Returns:
-            Tuple of (deviation in cm, assessment, visualization frame)
+            Tuple of (deviation in cm, assessment, visualization frame or None)
         """
         # Get knee position
         knee_position = pose_data.landmarks["knee"].as_tuple()
@@ -49,26 +74,37 @@ class KOPSAnalyzer:
         deviation_pixels = knee_position[0] - pedal_position[0]
         
         # Convert to cm (would need proper calibration)
-        # Assuming 1 cm = x pixels based on calibration data
-        pixels_per_cm = 10  # This would come from calibration
-        deviation_cm = deviation_pixels / pixels_per_cm
-        
-        # Assess the alignment
-        if abs(deviation_cm) < 1.0:
-            assessment = "Good KOPS alignment"
-        elif deviation_cm < 0:
-            assessment = f"Knee is {abs(deviation_cm):.1f} cm behind pedal spindle"
-        else:
-            assessment = f"Knee is {deviation_cm:.1f} cm ahead of pedal spindle"
-            
-        # Create visualization
-        viz_frame = self.create_visualization(frame, knee_position, pedal_position, deviation_cm)
+        deviation_cm = deviation_pixels / self.pixels_per_cm
+        
+        # Assess the alignment, comparing against the 1 cm tolerance in pixels
+        if deviation_pixels != self._last_deviation_pixels:
+            tolerance = self.pixels_per_cm
+            index = (deviation_pixels >= tolerance) - (deviation_pixels <= -tolerance) + 1
+            self._last_assessment = self._assessment_templates[index].format(abs(deviation_cm))
+            self._last_deviation_pixels = deviation_pixels
+        assessment = self._last_assessment
+        
+        # Create visualization, unless nothing will display it
+        viz_frame = None
+        if draw_viz:
+            viz_frame = self.create_visualization(frame, knee_position, pedal_position, deviation_cm)
         
         return (deviation_cm, assessment, viz_frame)
     
     def create_visualization(self, frame, knee_pos, pedal_pos, deviation):
-        """Create visualization showing KOPS alignment."""
-        result = frame.copy()
+        """
+        Create visualization showing KOPS alignment.
+        
+        The returned image is the input frame when in_place_draw is set, otherwise
+        a buffer owned by the analyzer that is overwritten by the next call.
+        """
+        if self.in_place_draw:
+            result = frame
+        else:
+            if self._viz_buf is None or self._viz_buf.shape != frame.shape:
+                self._viz_buf = np.empty_like(frame)
+            np.copyto(self._viz_buf, frame)
+            result = self._viz_buf
         
         # Draw vertical line from knee
         cv2.line(result, 
@@ -1,66 +1,486 @@
 """
 Pose detection logic for the Bike Fit Analyzer.
 """
+import queue
+import threading
+import time
 import cv2
 import mediapipe as mp
 import numpy as np
 from typing import Dict, Tuple, Optional, List
 
 from bike_fit_analyzer.models.angles import Point, Angle, PoseData
-from bike_fit_analyzer.core.angle_calculator import create_angle
+from bike_fit_analyzer.core.angle_calculator import compute_angles, angles_at_rows
+from bike_fit_analyzer.core.pose_worker import PoseProcessWorker
+from bike_fit_analyzer.core.pose_landmarker import TaskPoseLandmarker
+from bike_fit_analyzer.utils.filters import OneEuroFilter
+from bike_fit_analyzer.utils.jit import NUMBA_AVAILABLE
 from bike_fit_analyzer.config.settings import (
     POSE_MODEL_COMPLEXITY,
     MIN_DETECTION_CONFIDENCE,
-    MIN_TRACKING_CONFIDENCE
+    MIN_TRACKING_CONFIDENCE,
+    SIDE_CHECK_INTERVAL,
+    MOTION_GATE_SIZE,
+    MOTION_GATE_THRESHOLD,
+    POSE_DETECT_INTERVAL,
+    POSE_INPUT_SCALE,
+    POSE_ADAPTIVE_COMPLEXITY,
+    POSE_LATENCY_TARGET_MS,
+    POSE_UPGRADE_FRAMES,
+    LANDMARK_FILTER_ENABLED,
+    LANDMARK_FILTER_MIN_CUTOFF,
+    LANDMARK_FILTER_BETA,
+    POSE_INFERENCE_PROCESS,
+    POSE_TASK_MODEL_DIR,
+    POSE_TASK_USE_GPU,
+    POSE_TASK_MODEL_PATH
 )
 
+# Landmarks extracted from each detection, in row order of the pixel array
+LANDMARK_NAMES = (
+    "nose",
+    "right_shoulder",
+    "right_elbow",
+    "right_wrist",
+    "right_hip",
+    "right_knee",
+    "right_ankle",
+    "left_shoulder",
+    "left_elbow",
+    "left_wrist",
+    "left_hip",
+    "left_knee",
+    "left_ankle"
+)
+# Plain integer landmark indices, so the per-frame loop avoids enum lookups
+POSE_LANDMARKS = tuple(mp.solutions.pose.PoseLandmark[name.upper()].value for name in LANDMARK_NAMES)
+
+# Landmarks whose visibility decides which side of the body is analyzed
+RIGHT_VISIBILITY_LANDMARKS = tuple(
+    mp.solutions.pose.PoseLandmark[name].value for name in ("RIGHT_SHOULDER", "RIGHT_HIP", "RIGHT_KNEE")
+)
+LEFT_VISIBILITY_LANDMARKS = tuple(
+    mp.solutions.pose.PoseLandmark[name].value for name in ("LEFT_SHOULDER", "LEFT_HIP", "LEFT_KNEE")
+)
+
+# Angles calculated for each pose as (angle type, first point, vertex, third point)
+ANGLE_DEFINITIONS = (
+    ("neck_angle", "nose", "shoulder", "hip"),
+    ("shoulder_angle", "hip", "shoulder", "elbow"),
+    ("elbow_angle", "shoulder", "elbow", "wrist"),
+    ("hip_angle", "shoulder", "hip", "knee"),
+    ("knee_angle", "hip", "knee", "ankle")
+)
+
+
+def _angle_rows(side: str) -> np.ndarray:
+    """Get the landmark rows of each angle's (a, b, c) points for one side of the body."""
+    def row(name: str) -> int:
+        return LANDMARK_NAMES.index(name if name == "nose" else f"{side}_{name}")
+    
+    return np.array([[row(a), row(b), row(c)] for _, a, b, c in ANGLE_DEFINITIONS], dtype=np.intp)
+
+
+# Row indices used to gather the (5, 3, 2) angle point array for each side
+ANGLE_ROWS = {
+    "right": _angle_rows("right"),
+    "left": _angle_rows("left")
+}
+
+# Pixel array row of each landmark reported in PoseData, for each side
+SELECTED_LANDMARKS = tuple(PoseData.LANDMARK_INDEX)
+SELECTED_ROWS = {
+    side: np.array([
+        LANDMARK_NAMES.index(name if name == "nose" else f"{side}_{name}")
+        for name in SELECTED_LANDMARKS
+    ], dtype=np.intp)
+    for side in ("right", "left")
+}
+
+# Landmark drawing styles are immutable, so build them once
+_LANDMARK_SPEC = mp.solutions.drawing_utils.DrawingSpec(color=(245, 117, 66), thickness=2, circle_radius=2)
+_CONNECTION_SPEC = mp.solutions.drawing_utils.DrawingSpec(color=(245, 66, 230), thickness=2)
+
+
+def draw_pose_landmarks(frame: np.ndarray, pose_landmarks) -> None:
+    """
+    Draw the MediaPipe landmark overlay onto a frame in place.
+    
+    Args:
+        frame: BGR frame to draw on
+        pose_landmarks: MediaPipe normalized landmark list
+    """
+    mp.solutions.drawing_utils.draw_landmarks(
+        frame,
+        pose_landmarks,
+        mp.solutions.pose.POSE_CONNECTIONS,
+        landmark_drawing_spec=_LANDMARK_SPEC,
+        connection_drawing_spec=_CONNECTION_SPEC
+    )
+
 
 class PoseDetector:
     """Handles pose detection and landmark processing."""
     
-    def __init__(self):
-        """Initialize the pose detector."""
+    def __init__(self, model_complexity: int = POSE_MODEL_COMPLEXITY, in_place_draw: bool = False,
+                 input_scale: float = POSE_INPUT_SCALE):
+        """
+        Initialize the pose detector.
+        
+        Args:
+            model_complexity: BlazePose model variant (0 = lite, 1 = full, 2 = heavy).
+                Inference cost grows with complexity; for a large, stable rider
+                silhouette 1 gives nearly the same landmarks as 2 at about half the cost.
+            in_place_draw: Draw landmarks directly onto the input frame instead of a copy,
+                for callers that do not need the undecorated frame afterwards
+            input_scale: Factor the frame is downscaled by before inference (1.0 = off),
+                reducing the color conversion and resize work on large frames
+        """
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_pose = mp.solutions.pose
-        self.pose = self.mp_pose.Pose(
+        self.model_complexity = model_complexity
+        self.in_place_draw = in_place_draw
+        self.input_scale = input_scale
+        self.pose = self._create_pose()
+        
+        # Optional background inference thread (see start())
+        self._worker: Optional[threading.Thread] = None
+        self._input: Optional[queue.Queue] = None
+        self._latest: Optional[Tuple[np.ndarray, Optional[PoseData]]] = None
+        self._error: Optional[Exception] = None
+        self._latest_lock = threading.Lock()
+        
+        # Held while the pose model runs or is replaced, so a complexity switch
+        # never closes the model under the background thread
+        self._pose_lock = threading.Lock()
+        
+        # Side of the body being analyzed; re-evaluated on the first detection
+        self._side = "right"
+        self._side_counter = SIDE_CHECK_INTERVAL
+        
+        # Motion gate: thumbnails of the current frame and of the last analyzed frame
+        gate_width, gate_height = MOTION_GATE_SIZE
+        self._gate_small = np.empty((gate_height, gate_width, 3), dtype=np.uint8)
+        self._gate_gray = np.empty((gate_height, gate_width), dtype=np.uint8)
+        self._gate_ref = np.empty((gate_height, gate_width), dtype=np.uint8)
+        self._gate_diff = np.empty((gate_height, gate_width), dtype=np.uint8)
+        self._last_results = None
+        self._last_pose_data = None
+        
+        # Frame counter for running inference only every POSE_DETECT_INTERVAL frames
+        self._frame_idx = 0
+        
+        # Adaptive complexity: the requested complexity is the ceiling, the
+        # smoothed inference time decides whether to step down or back up
+        self._max_complexity = model_complexity
+        self._latency_ema = 0.0
+        self._fast_frames = 0
+        
+        # Optional landmark smoothing
+        self._landmark_filter = (
+            OneEuroFilter(LANDMARK_FILTER_MIN_CUTOFF, LANDMARK_FILTER_BETA)
+            if LANDMARK_FILTER_ENABLED else None
+        )
+        
+        # Reused buffers for the downscaled and RGB input frames and normalized landmark coordinates
+        self._small_buf = None
+        self._rgb_buf = None
+        self._pts_buf = np.empty((len(LANDMARK_NAMES), 2), dtype=np.float32)
+        
+        # Reused buffers for pixel coordinates and the angle calculation
+        angle_count = len(ANGLE_DEFINITIONS)
+        self._frame_scale = np.empty(2, dtype=np.float32)
+        self._pixels = np.empty((len(LANDMARK_NAMES), 2), dtype=np.int32)
+        self._triples = np.empty((angle_count, 3, 2), dtype=np.int32)
+        self._ba = np.empty((angle_count, 2), dtype=np.float32)
+        self._bc = np.empty((angle_count, 2), dtype=np.float32)
+        self._angle_values = np.empty(angle_count, dtype=np.float32)
+    
+    def _create_pose(self):
+        """Create a MediaPipe Pose instance for the current model complexity."""
+        pose_kwargs = dict(
             static_image_mode=False,
-            model_complexity=POSE_MODEL_COMPLEXITY,
-            smooth_landmarks=True,
+            model_complexity=self.model_complexity,
+            # MediaPipe's temporal smoothing assumes consecutive frames
+            smooth_landmarks=POSE_DETECT_INTERVAL <= 1,
             min_detection_confidence=MIN_DETECTION_CONFIDENCE,
             min_tracking_confidence=MIN_TRACKING_CONFIDENCE
         )
+        
+        if POSE_TASK_MODEL_DIR or POSE_TASK_MODEL_PATH:
+            return TaskPoseLandmarker(
+                POSE_TASK_MODEL_DIR,
+                model_complexity=self.model_complexity,
+                use_gpu=POSE_TASK_USE_GPU,
+                min_detection_confidence=MIN_DETECTION_CONFIDENCE,
+                min_tracking_confidence=MIN_TRACKING_CONFIDENCE,
+                model_path=POSE_TASK_MODEL_PATH
+            )
+        if POSE_INFERENCE_PROCESS:
+            return PoseProcessWorker(**pose_kwargs)
+        return self.mp_pose.Pose(**pose_kwargs)
+    
+    def close(self):
+        """Release the pose model and any worker thread or process."""
+        try:
+            self.stop()
+        finally:
+            self.pose.close()
     
-    def detect_pose(self, frame: np.ndarray) -> Tuple[np.ndarray, Optional[PoseData]]:
+    def start(self):
         """
-        Detect pose in the given frame.
+        Run pose detection on a background thread.
+        
+        MediaPipe releases the GIL while its graph runs, so inference overlaps
+        capture and rendering on other threads. Frames are handed over with
+        submit() and results collected with poll_latest(). An error raised by
+        detection is re-raised by the next poll_latest() or stop() call.
+        """
+        if self._worker is not None:
+            return
+        
+        self._input = queue.Queue(maxsize=1)
+        self._worker = threading.Thread(target=self._detect_loop, daemon=True)
+        self._worker.start()
+    
+    def stop(self):
+        """
+        Stop the background detection thread, if running.
+        
+        Raises:
+            Exception: The last detection error not yet reported by poll_latest()
+        """
+        if self._worker is None:
+            return
+        
+        self._submit(None)
+        self._worker.join()
+        self._worker = None
+        self._input = None
+        
+        # Do not hand a result from this session to the next one
+        with self._latest_lock:
+            self._latest = None
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+    
+    def submit(self, frame: np.ndarray):
+        """
+        Queue a frame for background detection, replacing any frame still waiting.
+        
+        The detector takes ownership of the frame until its result is published.
+        The background thread is started if it is not running yet.
         
         Args:
             frame: Input frame
+        """
+        if self._worker is None:
+            self.start()
+        self._submit(frame)
+    
+    def poll_latest(self) -> Optional[Tuple[np.ndarray, Optional[PoseData]]]:
+        """
+        Get the most recent background detection result without waiting.
+        
+        Returns:
+            Tuple of (processed frame, pose data), or None if no frame finished yet
+        
+        Raises:
+            Exception: The error of a background detection that failed since the last call
+        """
+        with self._latest_lock:
+            error, self._error = self._error, None
+            latest = self._latest
+        if error is not None:
+            raise error
+        return latest
+    
+    def _submit(self, item: Optional[np.ndarray]):
+        """Put an item in the single-slot input queue, dropping a stale frame."""
+        while True:
+            try:
+                self._input.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._input.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _detect_loop(self):
+        """Detect poses on submitted frames until stopped."""
+        while True:
+            frame = self._input.get()
+            if frame is None:
+                return
+            
+            # Keep the thread alive after a failed frame and report the error to the caller
+            try:
+                result = self.detect_pose(frame)
+            except Exception as e:
+                with self._latest_lock:
+                    self._error = e
+                continue
+            
+            with self._latest_lock:
+                self._latest = result
+    
+    def set_model_complexity(self, model_complexity: int):
+        """
+        Switch the pose model complexity at runtime.
+        
+        With adaptive complexity enabled this is also the highest complexity
+        the detector will step back up to.
+        
+        Args:
+            model_complexity: BlazePose model variant (0, 1 or 2)
+        """
+        model_complexity = max(0, min(2, int(model_complexity)))
+        self._max_complexity = model_complexity
+        self._switch_complexity(model_complexity)
+    
+    def _switch_complexity(self, model_complexity: int):
+        """Rebuild the pose model with another complexity, if it differs."""
+        # A fixed model file does not change with the complexity
+        if model_complexity == self.model_complexity or POSE_TASK_MODEL_PATH:
+            return
+        
+        # Build the new model first so a failure leaves the current one in place,
+        # then swap it in between two inferences of the background thread
+        previous = self.model_complexity
+        self.model_complexity = model_complexity
+        try:
+            pose = self._create_pose()
+        except Exception:
+            self.model_complexity = previous
+            raise
+        with self._pose_lock:
+            old_pose, self.pose = self.pose, pose
+        old_pose.close()
+        self._last_results = None
+        self._latency_ema = 0.0
+        self._fast_frames = 0
+    
+    def _adapt_complexity(self, latency_ms: float):
+        """
+        Pick the cheapest model complexity that keeps inference within budget.
+        
+        Rebuilding the model takes a few tens of milliseconds, so changes only
+        happen on a sustained trend of the smoothed latency.
+        
+        Args:
+            latency_ms: Duration of the last pose inference in milliseconds
+        """
+        if self._latency_ema == 0.0:
+            self._latency_ema = latency_ms
+        else:
+            self._latency_ema = 0.9 * self._latency_ema + 0.1 * latency_ms
+        
+        if self._latency_ema > 1.3 * POSE_LATENCY_TARGET_MS and self.model_complexity > 0:
+            print(f"Pose inference over budget ({self._latency_ema:.0f} ms), "
+                  f"model complexity {self.model_complexity - 1}")
+            self._switch_complexity(self.model_complexity - 1)
+        elif self._latency_ema < 0.5 * POSE_LATENCY_TARGET_MS and self.model_complexity < self._max_complexity:
+            self._fast_frames += 1
+            if self._fast_frames >= POSE_UPGRADE_FRAMES:
+                print(f"Pose inference within budget, model complexity {self.model_complexity + 1}")
+                self._switch_complexity(self.model_complexity + 1)
+        else:
+            self._fast_frames = 0
+    
+    def _is_static(self, frame: np.ndarray) -> bool:
+        """
+        Check whether the frame is nearly identical to the last frame that was analyzed.
+        
+        Compares small grayscale thumbnails, which costs far less than a pose
+        inference. The thumbnail of the current frame is left in self._gate_gray.
+        
+        Args:
+            frame: Input BGR frame
             
         Returns:
-            Tuple of (processed frame with landmarks drawn, pose data)
+            True if the previous pose results can be reused
         """
-        # Convert the BGR image to RGB
-        image_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        cv2.resize(frame, MOTION_GATE_SIZE, dst=self._gate_small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._gate_small, cv2.COLOR_BGR2GRAY, dst=self._gate_gray)
         
-        # Process the image and detect pose
-        results = self.pose.process(image_rgb)
+        if self._last_results is None:
+            return False
         
-        # Draw pose landmarks on the frame
-        processed_frame = frame.copy()
+        diff = cv2.absdiff(self._gate_gray, self._gate_ref, dst=self._gate_diff)
+        return cv2.mean(diff)[0] < MOTION_GATE_THRESHOLD
+    
+    @property
+    def last_pose_landmarks(self):
+        """MediaPipe landmarks of the last detection, or None if no pose was found."""
+        if self._last_results is None:
+            return None
+        return self._last_results.pose_landmarks
+    
+    def detect_pose(self, frame: np.ndarray, draw_viz: bool = True) -> Tuple[np.ndarray, Optional[PoseData]]:
+        """
+        Detect pose in the given frame.
+        
+        Args:
+            frame: Input frame (drawn on directly when in_place_draw is set)
+            draw_viz: Whether to draw the landmarks; when False the input frame
+                is returned untouched and no copy is made
+            
+        Returns:
+            Tuple of (processed frame with landmarks drawn, pose data)
+        """
+        # Reuse the previous results between scheduled inference frames, or when
+        # the scene has not visibly changed
+        self._frame_idx += 1
+        skip = self._last_results is not None and self._frame_idx % POSE_DETECT_INTERVAL != 0
+        static = skip or self._is_static(frame)
+        if static:
+            results = self._last_results
+        else:
+            # Downscale before inference if requested
+            source = frame
+            if self.input_scale < 1.0:
+                height, width = frame.shape[:2]
+                size = (max(1, int(width * self.input_scale)), max(1, int(height * self.input_scale)))
+                if self._small_buf is None or self._small_buf.shape[1::-1] != size:
+                    self._small_buf = np.empty((size[1], size[0]) + frame.shape[2:], dtype=frame.dtype)
+                cv2.resize(frame, size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+                source = self._small_buf
+            
+            # Convert the BGR image to RGB into a buffer reused across frames
+            if self._rgb_buf is None or self._rgb_buf.shape != source.shape:
+                self._rgb_buf = np.empty_like(source)
+            self._rgb_buf.flags.writeable = True
+            cv2.cvtColor(source, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+            
+            # Process the image and detect pose (read-only input lets MediaPipe skip a copy)
+            self._rgb_buf.flags.writeable = False
+            start = time.perf_counter()
+            with self._pose_lock:
+                results = self.pose.process(self._rgb_buf)
+            if POSE_ADAPTIVE_COMPLEXITY and not POSE_TASK_MODEL_PATH:
+                self._adapt_complexity((time.perf_counter() - start) * 1000.0)
+            self._last_results = results
+            self._gate_ref, self._gate_gray = self._gate_gray, self._gate_ref
+        
+        # Draw pose landmarks on the frame, or on a copy if the caller keeps the original
+        processed_frame = frame if self.in_place_draw or not draw_viz else frame.copy()
         if results.pose_landmarks:
-            self.mp_drawing.draw_landmarks(
-                processed_frame, 
-                results.pose_landmarks,
-                self.mp_pose.POSE_CONNECTIONS,
-                landmark_drawing_spec=self.mp_drawing.DrawingSpec(color=(245, 117, 66), thickness=2, circle_radius=2),
-                connection_drawing_spec=self.mp_drawing.DrawingSpec(color=(245, 66, 230), thickness=2)
-            )
+            if draw_viz:
+                draw_pose_landmarks(processed_frame, results.pose_landmarks)
             
-            # Extract landmarks and calculate angles
-            pose_data = self._process_landmarks(results.pose_landmarks, frame.shape)
-            return processed_frame, pose_data
+            # Extract landmarks and calculate angles, unless the same results were
+            # already processed for the previous frame
+            if not static or self._last_pose_data is None:
+                self._last_pose_data = self._process_landmarks(results.pose_landmarks, frame.shape)
+            return processed_frame, self._last_pose_data
         
+        # Re-select the visible side as soon as the rider is detected again
+        self._side_counter = SIDE_CHECK_INTERVAL
+        self._last_pose_data = None
+        if self._landmark_filter is not None:
+            self._landmark_filter.reset()
         return processed_frame, None
     
     def _process_landmarks(self, pose_landmarks, frame_shape: Tuple[int, int, int]) -> PoseData:
@@ -77,110 +497,61 @@ class PoseDetector:
         landmarks = pose_landmarks.landmark
         height, width, _ = frame_shape
         
-        # Extract key points
-        points = {
-            "nose": Point(
-                x=int(landmarks[self.mp_pose.PoseLandmark.NOSE].x * width),
-                y=int(landmarks[self.mp_pose.PoseLandmark.NOSE].y * height)
-            ),
-            "right_shoulder": Point(
-                x=int(landmarks[self.mp_pose.PoseLandmark.RIGHT_SHOULDER].x * width),
-                y=int(landmarks[self.mp_pose.PoseLandmark.RIGHT_SHOULDER].y * height)
-            ),
-            "right_elbow": Point(
-                x=int(landmarks[self.mp_pose.PoseLandmark.RIGHT_ELBOW].x * width),
-                y=int(landmarks[self.mp_pose.PoseLandmark.RIGHT_ELBOW].y * height)
-            ),
-            "right_wrist": Point(
-                x=int(landmarks[self.mp_pose.PoseLandmark.RIGHT_WRIST].x * width),
-                y=int(landmarks[self.mp_pose.PoseLandmark.RIGHT_WRIST].y * height)
-            ),
-            "right_hip": Point(
-                x=int(landmarks[self.mp_pose.PoseLandmark.RIGHT_HIP].x * width),
-                y=int(landmarks[self.mp_pose.PoseLandmark.RIGHT_HIP].y * height)
-            ),
-            "right_knee": Point(
-                x=int(landmarks[self.mp_pose.PoseLandmark.RIGHT_KNEE].x * width),
-                y=int(landmarks[self.mp_pose.PoseLandmark.RIGHT_KNEE].y * height)
-            ),
-            "right_ankle": Point(
-                x=int(landmarks[self.mp_pose.PoseLandmark.RIGHT_ANKLE].x * width),
-                y=int(landmarks[self.mp_pose.PoseLandmark.RIGHT_ANKLE].y * height)
-            ),
-            "left_shoulder": Point(
-                x=int(landmarks[self.mp_pose.PoseLandmark.LEFT_SHOULDER].x * width),
-                y=int(landmarks[self.mp_pose.PoseLandmark.LEFT_SHOULDER].y * height)
-            ),
-            "left_elbow": Point(
-                x=int(landmarks[self.mp_pose.PoseLandmark.LEFT_ELBOW].x * width),
-                y=int(landmarks[self.mp_pose.PoseLandmark.LEFT_ELBOW].y * height)
-            ),
-            "left_wrist": Point(
-                x=int(landmarks[self.mp_pose.PoseLandmark.LEFT_WRIST].x * width),
-                y=int(landmarks[self.mp_pose.PoseLandmark.LEFT_WRIST].y * height)
-            ),
-            "left_hip": Point(
-                x=int(landmarks[self.mp_pose.PoseLandmark.LEFT_HIP].x * width),
-                y=int(landmarks[self.mp_pose.PoseLandmark.LEFT_HIP].y * height)
-            ),
-            "left_knee": Point(
-                x=int(landmarks[self.mp_pose.PoseLandmark.LEFT_KNEE].x * width),
-                y=int(landmarks[self.mp_pose.PoseLandmark.LEFT_KNEE].y * height)
-            ),
-            "left_ankle": Point(
-                x=int(landmarks[self.mp_pose.PoseLandmark.LEFT_ANKLE].x * width),
-                y=int(landmarks[self.mp_pose.PoseLandmark.LEFT_ANKLE].y * height)
-            )
-        }
+        # Gather normalized coordinates into the preallocated buffer
+        pts = self._pts_buf
+        for row, landmark_id in enumerate(POSE_LANDMARKS):
+            landmark = landmarks[landmark_id]
+            pts[row, 0] = landmark.x
+            pts[row, 1] = landmark.y
         
-        # Determine which side is more visible (for side view analysis)
-        right_visibility = (
-            landmarks[self.mp_pose.PoseLandmark.RIGHT_SHOULDER].visibility +
-            landmarks[self.mp_pose.PoseLandmark.RIGHT_HIP].visibility +
-            landmarks[self.mp_pose.PoseLandmark.RIGHT_KNEE].visibility
-        )
+        # Scale all landmarks to pixel coordinates in a single vectorized pass,
+        # truncating into the preallocated integer buffer
+        self._frame_scale[0] = width
+        self._frame_scale[1] = height
+        pixels = self._pixels
+        if self._landmark_filter is None:
+            np.multiply(pts, self._frame_scale, out=pixels, casting="unsafe")
+        else:
+            # Smooth in pixel space, where the filter's speed coefficient applies
+            np.multiply(pts, self._frame_scale, out=pts)
+            np.copyto(pixels, self._landmark_filter(pts, time.monotonic()), casting="unsafe")
         
-        left_visibility = (
-            landmarks[self.mp_pose.PoseLandmark.LEFT_SHOULDER].visibility +
-            landmarks[self.mp_pose.PoseLandmark.LEFT_HIP].visibility +
-            landmarks[self.mp_pose.PoseLandmark.LEFT_KNEE].visibility
-        )
+        # Determine which side is more visible (for side view analysis), re-checking
+        # only periodically so single-frame visibility flukes do not flip the side
+        self._side_counter += 1
+        if self._side_counter >= SIDE_CHECK_INTERVAL:
+            right_visibility = sum(landmarks[idx].visibility for idx in RIGHT_VISIBILITY_LANDMARKS)
+            left_visibility = sum(landmarks[idx].visibility for idx in LEFT_VISIBILITY_LANDMARKS)
+            
+            # Select the more visible side
+            self._side = "right" if right_visibility > left_visibility else "left"
+            self._side_counter = 0
+        side = self._side
         
-        # Select the more visible side
-        if right_visibility > left_visibility:
-            shoulder = points["right_shoulder"]
-            elbow = points["right_elbow"]
-            wrist = points["right_wrist"]
-            hip = points["right_hip"]
-            knee = points["right_knee"]
-            ankle = points["right_ankle"]
-        else:
-            shoulder = points["left_shoulder"]
-            elbow = points["left_elbow"]
-            wrist = points["left_wrist"]
-            hip = points["left_hip"]
-            knee = points["left_knee"]
-            ankle = points["left_ankle"]
-        
-        # Calculate angles
-        angles = {
-            "neck_angle": create_angle(points["nose"], shoulder, hip, "neck_angle"),
-            "shoulder_angle": create_angle(hip, shoulder, elbow, "shoulder_angle"),
-            "elbow_angle": create_angle(shoulder, elbow, wrist, "elbow_angle"),
-            "hip_angle": create_angle(shoulder, hip, knee, "hip_angle"),
-            "knee_angle": create_angle(hip, knee, ankle, "knee_angle")
+        # Gather the selected side's landmarks into the pose's coordinate array
+        # (the only per-frame array allocation) and create Points from it
+        landmarks_xy = pixels[SELECTED_ROWS[side]]
+        selected_points = {
+            name: Point(x, y)
+            for name, (x, y) in zip(SELECTED_LANDMARKS, landmarks_xy.tolist())
         }
         
-        # Create selected points dictionary for visualization
-        selected_points = {
-            "nose": points["nose"],
-            "shoulder": shoulder,
-            "elbow": elbow,
-            "wrist": wrist,
-            "hip": hip,
-            "knee": knee,
-            "ankle": ankle
+        # Calculate all angles in a single batched pass
+        if NUMBA_AVAILABLE:
+            # A single compiled loop straight over the pixel array
+            angle_values = angles_at_rows(pixels, ANGLE_ROWS[side], self._angle_values)
+        else:
+            np.take(pixels, ANGLE_ROWS[side], axis=0, out=self._triples)
+            angle_values = compute_angles(self._triples, self._ba, self._bc, self._angle_values)
+        angles = {
+            angle_type: Angle(
+                value=value,
+                angle_type=angle_type,
+                point_a=selected_points[a],
+                point_b=selected_points[b],
+                point_c=selected_points[c]
+            )
+            for (angle_type, a, b, c), value in zip(ANGLE_DEFINITIONS, angle_values.tolist())
         }
         
-        return PoseData(landmarks=selected_points, angles=angles)
-
+        return PoseData(landmarks=selected_points, angles=angles, landmarks_xy=landmarks_xy)
@@ -0,0 +1,102 @@
+"""
+MediaPipe Tasks pose inference backend for the Bike Fit Analyzer.
+"""
+import os
+import time
+from types import SimpleNamespace
+from typing import Optional
+
+import mediapipe as mp
+import numpy as np
+from mediapipe.framework.formats import landmark_pb2
+
+# Pose landmarker model bundles for each model complexity
+POSE_TASK_MODELS = {
+    0: "pose_landmarker_lite.task",
+    1: "pose_landmarker_full.task",
+    2: "pose_landmarker_heavy.task"
+}
+
+
+class TaskPoseLandmarker:
+    """
+    Runs the MediaPipe Tasks PoseLandmarker, preferably on the GPU delegate.
+    
+    The legacy mediapipe.solutions.pose.Pose only runs on the CPU; the Tasks
+    API can hand inference to the GPU. If the GPU delegate cannot be created
+    the landmarker falls back to the CPU. Mirrors the process()/close()
+    interface of mediapipe.solutions.pose.Pose so PoseDetector can use either.
+    """
+    
+    def __init__(self, model_dir: Optional[str], model_complexity: int = 1, use_gpu: bool = True,
+                 min_detection_confidence: float = 0.5, min_tracking_confidence: float = 0.5,
+                 model_path: Optional[str] = None):
+        """
+        Initialize the pose landmarker.
+        
+        Args:
+            model_dir: Directory holding the pose_landmarker_*.task model bundles
+                (not needed when model_path is given)
+            model_complexity: Model variant (0 = lite, 1 = full, 2 = heavy)
+            use_gpu: Whether to try the GPU delegate first
+            min_detection_confidence: Minimum pose detection confidence
+            min_tracking_confidence: Minimum pose tracking confidence
+            model_path: Optional path of a specific .task bundle, such as a quantized
+                model, loaded instead of the bundle for the model complexity
+        """
+        vision = mp.tasks.vision
+        if model_path is None:
+            model_path = os.path.join(model_dir, POSE_TASK_MODELS[model_complexity])
+        delegates = [mp.tasks.BaseOptions.Delegate.CPU]
+        if use_gpu:
+            delegates.insert(0, mp.tasks.BaseOptions.Delegate.GPU)
+        
+        self.landmarker = None
+        for delegate in delegates:
+            options = vision.PoseLandmarkerOptions(
+                base_options=mp.tasks.BaseOptions(model_asset_path=model_path, delegate=delegate),
+                running_mode=vision.RunningMode.VIDEO,
+                num_poses=1,
+                min_pose_detection_confidence=min_detection_confidence,
+                min_tracking_confidence=min_tracking_confidence
+            )
+            try:
+                self.landmarker = vision.PoseLandmarker.create_from_options(options)
+                break
+            except (RuntimeError, NotImplementedError) as e:
+                if delegate == delegates[-1]:
+                    raise
+                print(f"GPU delegate unavailable, falling back to CPU: {e}")
+        
+        self._last_timestamp_ms = -1
+    
+    def process(self, image: np.ndarray):
+        """
+        Detect the pose in an RGB image.
+        
+        Args:
+            image: RGB image
+        
+        Returns:
+            Results object with a pose_landmarks attribute, like Pose.process()
+        """
+        # Video mode needs strictly increasing timestamps
+        timestamp_ms = max(int(time.monotonic() * 1000), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+        
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=np.ascontiguousarray(image))
+        result = self.landmarker.detect_for_video(mp_image, timestamp_ms)
+        
+        if not result.pose_landmarks:
+            return SimpleNamespace(pose_landmarks=None)
+        
+        landmark_list = landmark_pb2.NormalizedLandmarkList()
+        for lm in result.pose_landmarks[0]:
+            landmark_list.landmark.add(x=lm.x, y=lm.y, z=lm.z, visibility=lm.visibility or 0.0)
+        return SimpleNamespace(pose_landmarks=landmark_list)
+    
+    def close(self):
+        """Release the landmarker."""
+        if self.landmarker is not None:
+            self.landmarker.close()
+            self.landmarker = None
@@ -0,0 +1,186 @@
+"""
+Out-of-process pose inference for the Bike Fit Analyzer.
+"""
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+from types import SimpleNamespace
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def _pose_worker(shm_name: str, shape: Tuple[int, ...], pose_kwargs: dict,
+                 request_queue, result_queue):
+    """
+    Run MediaPipe Pose on frames written to shared memory.
+    
+    Each request on the request queue means a new frame is ready in shared memory;
+    the worker answers with an (N, 4) float32 array of landmark x, y, z and
+    visibility, or None if no pose was found. A None request stops the worker.
+    If the worker fails, the error message is sent as a str before it exits.
+    
+    Args:
+        shm_name: Name of the shared memory block holding the RGB frame
+        shape: Shape of the frame
+        pose_kwargs: Keyword arguments for mediapipe.solutions.pose.Pose
+        request_queue: Queue of frame-ready notifications
+        result_queue: Queue receiving the landmark arrays
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frame = None
+    try:
+        import mediapipe as mp
+        
+        frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+        with mp.solutions.pose.Pose(**pose_kwargs) as pose:
+            while request_queue.get() is not None:
+                results = pose.process(frame)
+                if results.pose_landmarks is None:
+                    result_queue.put(None)
+                    continue
+                
+                result_queue.put(np.array(
+                    [(lm.x, lm.y, lm.z, lm.visibility) for lm in results.pose_landmarks.landmark],
+                    dtype=np.float32
+                ))
+    except Exception as e:
+        # Report the failure instead of leaving the parent waiting for a result
+        try:
+            result_queue.put_nowait(f"{type(e).__name__}: {e}")
+        except queue.Full:
+            pass
+    finally:
+        # Release the view first: closing shared memory with a buffer still exported raises
+        frame = None
+        shm.close()
+
+
+class PoseProcessWorker:
+    """
+    Runs MediaPipe Pose in a separate process.
+    
+    Frames are passed through shared memory and only the compact landmark array
+    comes back, so inference runs on its own core without holding the GIL of
+    the capture and drawing threads. Mirrors the process()/close() interface
+    of mediapipe.solutions.pose.Pose so PoseDetector can use either.
+    """
+    
+    # How often a waiting call checks that the worker process is still alive (s)
+    POLL_INTERVAL = 0.5
+    
+    # How long close() waits for the worker to exit before terminating it (s)
+    CLOSE_TIMEOUT = 5.0
+    
+    def __init__(self, **pose_kwargs):
+        """
+        Initialize the pose worker. The process starts with the first frame.
+        
+        Args:
+            **pose_kwargs: Keyword arguments for mediapipe.solutions.pose.Pose
+        """
+        self.pose_kwargs = pose_kwargs
+        self._context = multiprocessing.get_context("spawn")
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._frame: Optional[np.ndarray] = None
+        self._process = None
+        self._requests = None
+        self._results = None
+    
+    def _start(self, shape: Tuple[int, ...]):
+        """Start the worker process for frames of the given shape."""
+        self._shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+        self._frame = np.ndarray(shape, dtype=np.uint8, buffer=self._shm.buf)
+        self._requests = self._context.Queue(maxsize=1)
+        self._results = self._context.Queue(maxsize=1)
+        self._process = self._context.Process(
+            target=_pose_worker,
+            args=(self._shm.name, shape, self.pose_kwargs, self._requests, self._results),
+            daemon=True
+        )
+        self._process.start()
+    
+    def process(self, image: np.ndarray):
+        """
+        Detect the pose in an RGB image.
+        
+        Args:
+            image: RGB image
+        
+        Returns:
+            Results object with a pose_landmarks attribute, like Pose.process()
+        
+        Raises:
+            RuntimeError: If the worker process failed or exited
+        """
+        from mediapipe.framework.formats import landmark_pb2
+        
+        if self._frame is None or self._frame.shape != image.shape:
+            self.close()
+            self._start(image.shape)
+        
+        np.copyto(self._frame, image)
+        self._requests.put(True)
+        landmarks = self._wait_for_result()
+        
+        if isinstance(landmarks, str):
+            self.close()
+            raise RuntimeError(f"Pose worker process failed: {landmarks}")
+        if landmarks is None:
+            return SimpleNamespace(pose_landmarks=None)
+        
+        landmark_list = landmark_pb2.NormalizedLandmarkList()
+        for x, y, z, visibility in landmarks.tolist():
+            landmark_list.landmark.add(x=x, y=y, z=z, visibility=visibility)
+        return SimpleNamespace(pose_landmarks=landmark_list)
+    
+    def _wait_for_result(self):
+        """
+        Wait for the worker's answer, checking that the process is still alive.
+        
+        Returns:
+            Landmark array, None if no pose was found, or the worker's error message
+        
+        Raises:
+            RuntimeError: If the worker process exited without answering
+        """
+        while True:
+            try:
+                return self._results.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                if self._process.is_alive():
+                    continue
+            
+            # The process is gone; pick up an error message it may have sent on the way out
+            try:
+                return self._results.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                exitcode = self._process.exitcode
+                self.close()
+                raise RuntimeError(f"Pose worker process exited unexpectedly (exit code {exitcode})")
+    
+    def close(self):
+        """Stop the worker process and release the shared memory."""
+        if self._process is not None:
+            # A request the worker never picked up can leave the queue full
+            try:
+                self._requests.put(None, timeout=self.POLL_INTERVAL)
+            except queue.Full:
+                self._process.terminate()
+            self._process.join(timeout=self.CLOSE_TIMEOUT)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+            self._process = None
+            
+            # Do not block interpreter exit on items left in the queues
+            self._requests.cancel_join_thread()
+            self._results.cancel_join_thread()
+            self._requests = None
+            self._results = None
+        
+        if self._shm is not None:
+            self._frame = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
@@ -3,17 +3,28 @@ Analyzer for saddle positioning and setback.
 """
 import cv2
 import numpy as np
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 
 from bike_fit_analyzer.models.angles import PoseData
 
 class SaddleAnalyzer:
     """Analyzes saddle position including setback."""
     
-    def __init__(self):
-        """Initialize the saddle analyzer."""
+    def __init__(self, in_place_draw: bool = False):
+        """
+        Initialize the saddle analyzer.
+        
+        Args:
+            in_place_draw: Draw the visualization directly onto the input frame instead
+                of a copy, for callers that do not need the undecorated frame afterwards
+        """
+        self.in_place_draw = in_place_draw
+        
         self.calibration_factor = 1.0  # Pixels to cm
         
+        # Visualization buffer reused across frames instead of copying into a new array
+        self._viz_buf: Optional[np.ndarray] = None
+        
     def detect_saddle_points(self, frame):
         """
         Detect saddle points in the frame.
@@ -37,16 +48,17 @@ class SaddleAnalyzer:
             "bottom_bracket": bottom_bracket
         }
         
-    def calculate_setback(self, frame, pose_data) -> Tuple[Dict[str, float], Optional[np.ndarray]]:
+    def calculate_setback(self, frame, pose_data, draw_viz: bool = True) -> Tuple[Dict[str, float], Optional[np.ndarray]]:
         """
         Calculate saddle setback and related measurements.
         
         Args:
             frame: Input frame
             pose_data: Processed pose data
+            draw_viz: Whether to render the visualization frame
             
         Returns:
-            Tuple of (measurements dict, visualization frame)
+            Tuple of (measurements dict, visualization frame or None)
         """
         # Detect saddle points
         points = self.detect_saddle_points(frame)
@@ -69,14 +81,27 @@ class SaddleAnalyzer:
             "setback_ratio": setback_cm / saddle_height_cm * 100 if saddle_height_cm > 0 else 0  # as percentage
         }
         
-        # Create visualization
-        viz_frame = self.create_visualization(frame, points, hip_position, measurements)
+        # Create visualization, unless nothing will display it
+        viz_frame = None
+        if draw_viz:
+            viz_frame = self.create_visualization(frame, points, hip_position, measurements)
         
         return (measurements, viz_frame)
     
     def create_visualization(self, frame, points, hip_position, measurements):
-        """Create visualization showing saddle setback and height."""
-        result = frame.copy()
+        """
+        Create visualization showing saddle setback and height.
+        
+        The returned image is the input frame when in_place_draw is set, otherwise
+        a buffer owned by the analyzer that is overwritten by the next call.
+        """
+        if self.in_place_draw:
+            result = frame
+        else:
+            if self._viz_buf is None or self._viz_buf.shape != frame.shape:
+                self._viz_buf = np.empty_like(frame)
+            np.copyto(self._viz_buf, frame)
+            result = self._viz_buf
         
         bb = points["bottom_bracket"]
         sr = points["saddle_reference"]
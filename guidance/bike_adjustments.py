@@ -10,21 +10,98 @@ from bike_fit_analyzer.models.bike_config import BikeConfig
 from bike_fit_analyzer.models.user_profile import UserProfile
 from bike_fit_analyzer.config.settings import IDEAL_ANGLES
 
+# Angles checked by the analyzer, in the order pose data reports them
+_POSE_ANGLE_ORDER = ("neck_angle", "shoulder_angle", "elbow_angle", "hip_angle", "knee_angle")
+ANALYZED_ANGLES = (
+    tuple(name for name in _POSE_ANGLE_ORDER if name in IDEAL_ANGLES)
+    + tuple(name for name in IDEAL_ANGLES if name not in _POSE_ANGLE_ORDER)
+)
 
-@dataclass
+# Priority and wording for each deviation severity (below minor, below moderate, above)
+SEVERITY_LEVELS = ((3, "slightly"), (2, "moderately"), (1, "significantly"))
+
+
+@dataclass(frozen=True)
 class AdjustmentRecommendation:
     """Represents a bike adjustment recommendation."""
+    __slots__ = ("component", "direction", "amount", "priority", "description", "angles_affected")
+    
     component: str
     direction: str
     amount: float
     priority: int  # 1 (highest) to 5 (lowest)
     description: str
     angles_affected: List[str]
+    
+    def __getstate__(self):
+        """Return the field values for pickling."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        """Restore the field values when unpickling (frozen instances reject setattr)."""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 
 class BikeAdjustmentAnalyzer:
     """Analyzes pose data and provides bike adjustment recommendations."""
     
+    # Recommendations for each angle type that is below / above its ideal range, as
+    # (component, direction, amount factor, description template, angles affected,
+    # priority offset, only for moderate/major deviations)
+    _LOW_TABLE = {
+        "neck_angle": (
+            ("handlebar", "raise", 1.0, "Raise handlebars {amt} to reduce neck flexion",
+             ["neck_angle", "shoulder_angle"], 0, False),
+            ("stem", "shorten", 0.5, "Consider a shorter stem to bring handlebars closer",
+             ["neck_angle", "shoulder_angle"], 1, True),
+        ),
+        "hip_angle": (
+            ("saddle", "back", 0.3, "Move saddle {amt} backward to open hip angle",
+             ["hip_angle"], 0, False),
+            ("handlebar", "raise", 0.5, "Raise handlebars {amt} to open hip angle",
+             ["hip_angle", "shoulder_angle"], 0, False),
+        ),
+        "knee_angle": (
+            ("saddle", "raise", 0.3, "Raise saddle {amt} to increase knee extension",
+             ["knee_angle", "hip_angle"], 0, False),
+        ),
+        "shoulder_angle": (
+            ("handlebar", "raise", 0.5, "Raise handlebars {amt} to open shoulder angle",
+             ["shoulder_angle", "neck_angle"], 0, False),
+        ),
+        "elbow_angle": (
+            ("stem", "extend", 0.3, "Consider a longer stem to increase elbow extension",
+             ["elbow_angle", "shoulder_angle"], 0, False),
+        ),
+    }
+    _HIGH_TABLE = {
+        "neck_angle": (
+            ("handlebar", "lower", 1.0, "Lower handlebars {amt} to increase neck flexion",
+             ["neck_angle", "shoulder_angle"], 0, False),
+        ),
+        "hip_angle": (
+            ("saddle", "forward", 0.3, "Move saddle {amt} forward to close hip angle",
+             ["hip_angle"], 0, False),
+            ("handlebar", "lower", 0.5, "Lower handlebars {amt} to close hip angle",
+             ["hip_angle", "shoulder_angle"], 0, True),
+        ),
+        "knee_angle": (
+            ("saddle", "lower", 0.3, "Lower saddle {amt} to reduce knee extension",
+             ["knee_angle", "hip_angle"], 0, False),
+        ),
+        "shoulder_angle": (
+            ("handlebar", "lower", 0.5, "Lower handlebars {amt} to close shoulder angle",
+             ["shoulder_angle", "neck_angle"], 0, False),
+            ("stem", "extend", 0.3, "Consider a longer stem to increase reach",
+             ["shoulder_angle"], 1, True),
+        ),
+        "elbow_angle": (
+            ("stem", "shorten", 0.3, "Consider a shorter stem to decrease elbow extension",
+             ["elbow_angle", "shoulder_angle"], 0, False),
+        ),
+    }
+    
     def __init__(self, bike_config: Optional[BikeConfig] = None, user_profile: Optional[UserProfile] = None):
         """
         Initialize the bike adjustment analyzer.
@@ -40,6 +117,19 @@ class BikeAdjustmentAnalyzer:
         self.minor_threshold = 5.0
         self.moderate_threshold = 10.0
         self.major_threshold = 15.0
+        
+        # Ideal ranges as arrays aligned with ANALYZED_ANGLES for vectorized checks
+        self._min = np.array([IDEAL_ANGLES[name][0] for name in ANALYZED_ANGLES], dtype=np.float64)
+        self._max = np.array([IDEAL_ANGLES[name][1] for name in ANALYZED_ANGLES], dtype=np.float64)
+        
+        # Every recommendation description, formatted once per template and severity
+        self._descriptions = {
+            (template, amount_text): template.format(amt=amount_text)
+            for table in (self._LOW_TABLE, self._HIGH_TABLE)
+            for entries in table.values()
+            for _, _, _, template, _, _, _ in entries
+            for _, amount_text in SEVERITY_LEVELS
+        }
     
     def analyze_pose(self, pose_data: PoseData) -> List[AdjustmentRecommendation]:
         """
@@ -53,217 +143,81 @@ class BikeAdjustmentAnalyzer:
         """
         recommendations = []
         
-        # Extract angle values
-        angles = pose_data.angle_values
-        
-        # Check each angle against ideal ranges
-        for angle_type, angle_value in angles.items():
-            if angle_type in IDEAL_ANGLES:
-                min_val, max_val = IDEAL_ANGLES[angle_type]
-                
-                # Check if angle is outside ideal range
-                if angle_value < min_val:
-                    deviation = min_val - angle_value
-                    recommendations.extend(self._generate_recommendations_for_low_angle(angle_type, deviation))
-                elif angle_value > max_val:
-                    deviation = angle_value - max_val
-                    recommendations.extend(self._generate_recommendations_for_high_angle(angle_type, deviation))
+        # Gather angle values in a fixed order; missing angles become NaN and never deviate
+        angles = pose_data.angles
+        values = np.fromiter(
+            (angles[name].value if name in angles else np.nan for name in ANALYZED_ANGLES),
+            dtype=np.float64, count=len(ANALYZED_ANGLES)
+        )
+        
+        # Check all angles against their ideal ranges at once
+        low_dev = self._min - values
+        high_dev = values - self._max
+        deviations = np.fmax(np.fmax(low_dev, high_dev), 0.0)
+        levels = np.digitize(deviations, (self.minor_threshold, self.moderate_threshold))
+        
+        # Only angles outside their range produce recommendations
+        for i in np.flatnonzero(deviations > 0).tolist():
+            priority, amount_text = SEVERITY_LEVELS[levels[i]]
+            deviation = float(deviations[i])
+            if low_dev[i] > 0:
+                recommendations.extend(self._generate_recommendations_for_low_angle(
+                    ANALYZED_ANGLES[i], deviation, priority, amount_text))
+            else:
+                recommendations.extend(self._generate_recommendations_for_high_angle(
+                    ANALYZED_ANGLES[i], deviation, priority, amount_text))
         
         # Sort recommendations by priority
         recommendations.sort(key=lambda r: r.priority)
         
         return recommendations
     
-    def _generate_recommendations_for_low_angle(self, angle_type: str, deviation: float) -> List[AdjustmentRecommendation]:
+    def _generate_recommendations_for_low_angle(self, angle_type: str, deviation: float,
+                                                  priority: int, amount_text: str) -> List[AdjustmentRecommendation]:
         """
         Generate recommendations for an angle that's too low.
         
         Args:
             angle_type: Type of angle
             deviation: Degrees below minimum ideal value
+            priority: Priority from the deviation severity
+            amount_text: Wording of the deviation severity
             
         Returns:
             List of recommendations
         """
-        recommendations = []
-        
-        # Set priority based on deviation
-        if deviation < self.minor_threshold:
-            priority = 3
-            amount_text = "slightly"
-        elif deviation < self.moderate_threshold:
-            priority = 2
-            amount_text = "moderately"
-        else:
-            priority = 1
-            amount_text = "significantly"
-        
-        # Generate recommendations based on angle type
-        if angle_type == "neck_angle":
-            recommendations.append(AdjustmentRecommendation(
-                component="handlebar",
-                direction="raise",
-                amount=deviation,
-                priority=priority,
-                description=f"Raise handlebars {amount_text} to reduce neck flexion",
-                angles_affected=["neck_angle", "shoulder_angle"]
-            ))
-            
-            if priority < 3:  # Only suggest for moderate/major issues
-                recommendations.append(AdjustmentRecommendation(
-                    component="stem",
-                    direction="shorten",
-                    amount=deviation * 0.5,
-                    priority=priority + 1,
-                    description=f"Consider a shorter stem to bring handlebars closer",
-                    angles_affected=["neck_angle", "shoulder_angle"]
-                ))
-        
-        elif angle_type == "hip_angle":
-            recommendations.append(AdjustmentRecommendation(
-                component="saddle",
-                direction="back",
-                amount=deviation * 0.3,
-                priority=priority,
-                description=f"Move saddle {amount_text} backward to open hip angle",
-                angles_affected=["hip_angle"]
-            ))
-            
-            recommendations.append(AdjustmentRecommendation(
-                component="handlebar",
-                direction="raise",
-                amount=deviation * 0.5,
-                priority=priority,
-                description=f"Raise handlebars {amount_text} to open hip angle",
-                angles_affected=["hip_angle", "shoulder_angle"]
-            ))
-        
-        elif angle_type == "knee_angle":
-            recommendations.append(AdjustmentRecommendation(
-                component="saddle",
-                direction="raise",
-                amount=deviation * 0.3,
-                priority=priority,
-                description=f"Raise saddle {amount_text} to increase knee extension",
-                angles_affected=["knee_angle", "hip_angle"]
-            ))
-        
-        elif angle_type == "shoulder_angle":
-            recommendations.append(AdjustmentRecommendation(
-                component="handlebar",
-                direction="raise",
-                amount=deviation * 0.5,
-                priority=priority,
-                description=f"Raise handlebars {amount_text} to open shoulder angle",
-                angles_affected=["shoulder_angle", "neck_angle"]
-            ))
-        
-        elif angle_type == "elbow_angle":
-            recommendations.append(AdjustmentRecommendation(
-                component="stem",
-                direction="extend",
-                amount=deviation * 0.3,
-                priority=priority,
-                description=f"Consider a longer stem to increase elbow extension",
-                angles_affected=["elbow_angle", "shoulder_angle"]
-            ))
-        
-        return recommendations
+        return self._recommendations_from_table(self._LOW_TABLE, angle_type, deviation, priority, amount_text)
     
-    def _generate_recommendations_for_high_angle(self, angle_type: str, deviation: float) -> List[AdjustmentRecommendation]:
+    def _generate_recommendations_for_high_angle(self, angle_type: str, deviation: float,
+                                                   priority: int, amount_text: str) -> List[AdjustmentRecommendation]:
         """
         Generate recommendations for an angle that's too high.
         
         Args:
             angle_type: Type of angle
             deviation: Degrees above maximum ideal value
+            priority: Priority from the deviation severity
+            amount_text: Wording of the deviation severity
             
         Returns:
             List of recommendations
         """
-        recommendations = []
-        
-        # Set priority based on deviation
-        if deviation < self.minor_threshold:
-            priority = 3
-            amount_text = "slightly"
-        elif deviation < self.moderate_threshold:
-            priority = 2
-            amount_text = "moderately"
-        else:
-            priority = 1
-            amount_text = "significantly"
-        
-        # Generate recommendations based on angle type
-        if angle_type == "neck_angle":
-            recommendations.append(AdjustmentRecommendation(
-                component="handlebar",
-                direction="lower",
-                amount=deviation,
-                priority=priority,
-                description=f"Lower handlebars {amount_text} to increase neck flexion",
-                angles_affected=["neck_angle", "shoulder_angle"]
-            ))
-        
-        elif angle_type == "hip_angle":
-            recommendations.append(AdjustmentRecommendation(
-                component="saddle",
-                direction="forward",
-                amount=deviation * 0.3,
-                priority=priority,
-                description=f"Move saddle {amount_text} forward to close hip angle",
-                angles_affected=["hip_angle"]
-            ))
-            
-            if priority < 3:  # Only suggest for moderate/major issues
-                recommendations.append(AdjustmentRecommendation(
-                    component="handlebar",
-                    direction="lower",
-                    amount=deviation * 0.5,
-                    priority=priority,
-                    description=f"Lower handlebars {amount_text} to close hip angle",
-                    angles_affected=["hip_angle", "shoulder_angle"]
-                ))
-        
-        elif angle_type == "knee_angle":
-            recommendations.append(AdjustmentRecommendation(
-                component="saddle",
-                direction="lower",
-                amount=deviation * 0.3,
-                priority=priority,
-                description=f"Lower saddle {amount_text} to reduce knee extension",
-                angles_affected=["knee_angle", "hip_angle"]
-            ))
-        
-        elif angle_type == "shoulder_angle":
-            recommendations.append(AdjustmentRecommendation(
-                component="handlebar",
-                direction="lower",
-                amount=deviation * 0.5,
-                priority=priority,
-                description=f"Lower handlebars {amount_text} to close shoulder angle",
-                angles_affected=["shoulder_angle", "neck_angle"]
-            ))
-            
-            if priority < 3:  # Only suggest for moderate/major issues
-                recommendations.append(AdjustmentRecommendation(
-                    component="stem",
-                    direction="extend",
-                    amount=deviation * 0.3,
-                    priority=priority + 1,
-                    description=f"Consider a longer stem to increase reach",
-                    angles_affected=["shoulder_angle"]
-                ))
-        
-        elif angle_type == "elbow_angle":
-            recommendations.append(AdjustmentRecommendation(
-                component="stem",
-                direction="shorten",
-                amount=deviation * 0.3,
-                priority=priority,
-                description=f"Consider a shorter stem to decrease elbow extension",
-                angles_affected=["elbow_angle", "shoulder_angle"]
-            ))
-        
-        return recommendations
-
+        return self._recommendations_from_table(self._HIGH_TABLE, angle_type, deviation, priority, amount_text)
+    
+    def _recommendations_from_table(self, table, angle_type: str, deviation: float,
+                                    priority: int, amount_text: str) -> List[AdjustmentRecommendation]:
+        """Build the recommendations listed for an angle type in a recommendation table."""
+        descriptions = self._descriptions
+        return [
+            AdjustmentRecommendation(
+                component=component,
+                direction=direction,
+                amount=deviation * factor,
+                priority=priority + priority_offset,
+                description=descriptions[template, amount_text],
+                angles_affected=list(angles_affected)
+            )
+            for component, direction, factor, template, angles_affected, priority_offset, major_only
+            in table.get(angle_type, ())
+            if not major_only or priority < 3
+        ]
@@ -6,11 +6,30 @@ from dataclasses import dataclass
 
 from bike_fit_analyzer.models.angles import PoseData
 from bike_fit_analyzer.guidance.bike_adjustments import AdjustmentRecommendation
+from bike_fit_analyzer.config.settings import IDEAL_ANGLES
 
 
-@dataclass
+# Summary label, ideal range and range text of each angle with an ideal range
+_SUMMARY_ANGLES = {
+    angle_type: (
+        angle_type.replace('_', ' ').title(),
+        min_val,
+        max_val,
+        f"(Ideal: {min_val}deg-{max_val}deg)"
+    )
+    for angle_type, (min_val, max_val) in IDEAL_ANGLES.items()
+}
+
+# Range of feedback priorities, from 1 (highest) to 5 (lowest)
+MIN_PRIORITY = 1
+MAX_PRIORITY = 5
+
+
+@dataclass(frozen=True)
 class FeedbackItem:
     """Represents a feedback item for the user."""
+    __slots__ = ("message", "type", "priority")
+    
     message: str
     type: str  # 'info', 'warning', 'success', 'error'
     priority: int  # 1 (highest) to 5 (lowest)
@@ -21,7 +40,9 @@ class FeedbackGenerator:
     
     def __init__(self):
         """Initialize the feedback generator."""
-        pass
+        # Feedback for the last set of inputs; consecutive frames usually repeat them
+        self._last_key = None
+        self._last_feedback: List[FeedbackItem] = []
     
     def generate_feedback(self, pose_data: PoseData, 
                          adjustments: List[AdjustmentRecommendation]) -> List[FeedbackItem]:
@@ -35,6 +56,39 @@ class FeedbackGenerator:
         Returns:
             List of feedback items
         """
+        # Check for specific postural issues
+        angles = pose_data.angle_values
+        neck_flexed = "neck_angle" in angles and angles["neck_angle"] < 65
+        hip_closed = "hip_angle" in angles and angles["hip_angle"] < 65
+        knee_locked = "knee_angle" in angles and angles["knee_angle"] > 170
+        
+        # The feedback depends only on these checks and the adjustments, so rebuild
+        # it only when they change
+        key = (
+            neck_flexed, hip_closed, knee_locked,
+            tuple((adj.component, adj.priority, adj.description) for adj in adjustments)
+        )
+        if key != self._last_key:
+            self._last_feedback = self._build_feedback(adjustments, neck_flexed, hip_closed, knee_locked)
+            self._last_key = key
+        
+        # Items are immutable, but callers get their own list
+        return list(self._last_feedback)
+    
+    def _build_feedback(self, adjustments: List[AdjustmentRecommendation], neck_flexed: bool,
+                        hip_closed: bool, knee_locked: bool) -> List[FeedbackItem]:
+        """
+        Build the feedback items for a set of adjustments and postural issues.
+        
+        Args:
+            adjustments: List of adjustment recommendations
+            neck_flexed: Whether the neck is excessively flexed
+            hip_closed: Whether the hip angle is very closed
+            knee_locked: Whether the knee is nearly locked at full extension
+            
+        Returns:
+            List of feedback items sorted by priority
+        """
         feedback_items = []
         
         # If no adjustments needed, provide positive feedback
@@ -61,19 +115,16 @@ class FeedbackGenerator:
                 priority=1
             ))
         
-        # Group adjustments by component
-        component_adjustments = {}
+        # Find the highest priority adjustment for each component in a single pass
+        # (the first one wins ties)
+        best_adjustments = {}
         for adjustment in adjustments:
-            component = adjustment.component
-            if component not in component_adjustments:
-                component_adjustments[component] = []
-            component_adjustments[component].append(adjustment)
+            current = best_adjustments.get(adjustment.component)
+            if current is None or adjustment.priority < current.priority:
+                best_adjustments[adjustment.component] = adjustment
         
         # Generate feedback for each component
-        for component, adj_list in component_adjustments.items():
-            # Get highest priority adjustment for this component
-            adjustment = min(adj_list, key=lambda x: x.priority)
-            
+        for component, adjustment in best_adjustments.items():
             # Create feedback message
             message = f"{component.title()}: {adjustment.description}"
             
@@ -92,24 +143,21 @@ class FeedbackGenerator:
             ))
         
         # Add general feedback on posture
-        angles = pose_data.angle_values
-        
-        # Check for specific postural issues
-        if "neck_angle" in angles and angles["neck_angle"] < 65:
+        if neck_flexed:
             feedback_items.append(FeedbackItem(
                 message="Your neck is excessively flexed, which may cause neck strain. Try raising your handlebars.",
                 type="warning",
                 priority=2
             ))
         
-        if "hip_angle" in angles and angles["hip_angle"] < 65:
+        if hip_closed:
             feedback_items.append(FeedbackItem(
                 message="Your hip angle is very closed, which may reduce power. Try adjusting your saddle position.",
                 type="warning",
                 priority=2
             ))
         
-        if "knee_angle" in angles and angles["knee_angle"] > 170:
+        if knee_locked:
             feedback_items.append(FeedbackItem(
                 message="Your knee is nearly locked at full extension, which may cause knee pain. Lower your saddle slightly.",
                 type="warning",
@@ -123,10 +171,12 @@ class FeedbackGenerator:
             priority=5
         ))
         
-        # Sort feedback by priority
-        feedback_items.sort(key=lambda item: item.priority)
+        # Sort feedback by priority with a stable bucket sort over the bounded priority range
+        buckets = [[] for _ in range(MAX_PRIORITY - MIN_PRIORITY + 1)]
+        for item in feedback_items:
+            buckets[item.priority - MIN_PRIORITY].append(item)
         
-        return feedback_items
+        return [item for bucket in buckets for item in bucket]
     
     def generate_summary(self, pose_data: PoseData, 
                         adjustments: List[AdjustmentRecommendation]) -> str:
@@ -143,48 +193,55 @@ class FeedbackGenerator:
         # Get feedback items
         feedback_items = self.generate_feedback(pose_data, adjustments)
         
-        # Create summary text
-        summary = "Bike Fit Analysis Summary\n"
-        summary += "========================\n\n"
+        # Collect the summary lines and join them once at the end
+        lines = [
+            "Bike Fit Analysis Summary",
+            "========================",
+            ""
+        ]
         
         # Add overall assessment
         if not adjustments:
-            summary += "Overall: Excellent bike fit! All angles are within ideal ranges.\n\n"
+            lines.append("Overall: Excellent bike fit! All angles are within ideal ranges.")
         elif any(adj.priority == 1 for adj in adjustments):
-            summary += "Overall: Significant adjustments needed to optimize your bike fit.\n\n"
+            lines.append("Overall: Significant adjustments needed to optimize your bike fit.")
         else:
-            summary += "Overall: Good bike fit with some minor adjustments recommended.\n\n"
+            lines.append("Overall: Good bike fit with some minor adjustments recommended.")
+        lines.append("")
         
         # Add angle measurements
-        summary += "Angle Measurements:\n"
-        summary += "------------------\n"
+        lines.append("Angle Measurements:")
+        lines.append("------------------")
         
         angles = pose_data.angle_values
-        from bike_fit_analyzer.config.settings import IDEAL_ANGLES
         
         for angle_type, angle_value in angles.items():
-            if angle_type in IDEAL_ANGLES:
-                min_val, max_val = IDEAL_ANGLES[angle_type]
+            summary_angle = _SUMMARY_ANGLES.get(angle_type)
+            if summary_angle is not None:
+                label, min_val, max_val, ideal_text = summary_angle
                 status = "✓" if min_val <= angle_value <= max_val else "✗"
-                summary += f"{angle_type.replace('_', ' ').title()}: {angle_value:.1f}deg {status} (Ideal: {min_val}deg-{max_val}deg)\n"
+                lines.append(f"{label}: {angle_value:.1f}deg {status} {ideal_text}")
         
-        summary += "\n"
+        lines.append("")
         
         # Add recommendations
         if adjustments:
-            summary += "Recommendations:\n"
-            summary += "---------------\n"
+            lines.append("Recommendations:")
+            lines.append("---------------")
             
             for i, adjustment in enumerate(adjustments[:5]):  # Top 5 recommendations
-                summary += f"{i+1}. {adjustment.description}\n"
+                lines.append(f"{i+1}. {adjustment.description}")
             
-            summary += "\n"
+            lines.append("")
         
         # Add general tips
-        summary += "General Tips:\n"
-        summary += "------------\n"
-        summary += "1. Small adjustments can make a big difference in comfort and performance.\n"
-        summary += "2. After making adjustments, ride for a short time to assess comfort before making further changes.\n"
-        summary += "3. Consider a professional bike fit for precise measurements and personalized guidance.\n"
+        lines.extend((
+            "General Tips:",
+            "------------",
+            "1. Small adjustments can make a big difference in comfort and performance.",
+            "2. After making adjustments, ride for a short time to assess comfort before making further changes.",
+            "3. Consider a professional bike fit for precise measurements and personalized guidance.",
+            ""
+        ))
         
-        return summary
\ No newline at end of file
+        return "\n".join(lines)
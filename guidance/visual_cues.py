@@ -2,6 +2,7 @@
 Visual cues for bike fit guidance.
 """
 import cv2
+import functools
 import numpy as np
 import math
 from typing import Dict, List, Tuple, Optional
@@ -9,6 +10,118 @@ from typing import Dict, List, Tuple, Optional
 from bike_fit_analyzer.models.angles import Angle, Point, PoseData
 from bike_fit_analyzer.config.settings import IDEAL_ANGLES, COLORS, FONT
 from bike_fit_analyzer.guidance.bike_adjustments import AdjustmentRecommendation
+from bike_fit_analyzer.utils.jit import njit
+
+# Landmarks (end point, vertex) of the target line drawn for each angle type
+TARGET_LINE_LANDMARKS = {
+    "neck_angle": ("nose", "shoulder"),
+    "shoulder_angle": ("hip", "shoulder"),
+    "elbow_angle": ("shoulder", "elbow"),
+    "hip_angle": ("shoulder", "hip"),
+    "knee_angle": ("hip", "knee")
+}
+
+# Arrow placement for each adjusted component, as (landmark, x offset, y offset,
+# vertical arrow), where a vertical flag of None picks the orientation from the direction
+ARROW_ANCHORS = {
+    "saddle": ("hip", 0, -50, True),           # near the hip
+    "handlebar": ("elbow", 50, 0, None),       # near the hands/elbow
+    "stem": ("shoulder", 80, -30, False)       # near the handlebar/stem area
+}
+
+# Directions drawn as vertical arrows, and those pointing up / left
+VERTICAL_DIRECTIONS = frozenset(("raise", "lower"))
+UP_DIRECTIONS = frozenset(("up", "raise"))
+LEFT_DIRECTIONS = frozenset(("left", "shorten", "back"))
+
+# Arrow labels pre-rendered when the cues are created
+ARROW_LABELS = ("Up", "Down", "Left", "Right", "Raise", "Lower", "Shorten", "Extend", "Back", "Forward")
+
+# Skeleton connections as (start, end) rows of PoseData.landmarks_xy
+SKELETON_SEGMENTS = np.array([
+    [PoseData.LANDMARK_INDEX[start], PoseData.LANDMARK_INDEX[end]]
+    for start, end in (
+        ("nose", "shoulder"),
+        ("shoulder", "elbow"),
+        ("elbow", "wrist"),
+        ("shoulder", "hip"),
+        ("hip", "knee"),
+        ("knee", "ankle")
+    )
+], dtype=np.intp)
+
+# Points (a, vertex b, c) of each angle type as rows of PoseData.landmarks_xy
+ANGLE_POINT_ROWS = {
+    angle_type: tuple(PoseData.LANDMARK_INDEX[name] for name in names)
+    for angle_type, names in (
+        ("neck_angle", ("nose", "shoulder", "hip")),
+        ("shoulder_angle", ("hip", "shoulder", "elbow")),
+        ("elbow_angle", ("shoulder", "elbow", "wrist")),
+        ("hip_angle", ("shoulder", "hip", "knee")),
+        ("knee_angle", ("hip", "knee", "ankle"))
+    )
+}
+
+# Ideal ranges and target (mid-range) values of the angles with a target line,
+# as arrays aligned with TARGET_ANGLES for vectorized range checks
+TARGET_ANGLES = tuple(name for name in TARGET_LINE_LANDMARKS if name in IDEAL_ANGLES)
+IDEAL_MIN = np.array([IDEAL_ANGLES[name][0] for name in TARGET_ANGLES], dtype=np.float64)
+IDEAL_MAX = np.array([IDEAL_ANGLES[name][1] for name in TARGET_ANGLES], dtype=np.float64)
+IDEAL_MID = (IDEAL_MIN + IDEAL_MAX) * 0.5
+
+
+@functools.lru_cache(maxsize=4096)
+def _rotation(angle_deg: float) -> Tuple[float, float]:
+    """Cosine and sine of a rotation angle, cached as angles recur across frames."""
+    angle_rad = math.radians(angle_deg)
+    return math.cos(angle_rad), math.sin(angle_rad)
+
+
+def _landmark_array(pose_data: PoseData) -> np.ndarray:
+    """Return the landmark coordinates as an (N, 2) int32 array in PoseData.LANDMARK_INDEX order."""
+    if pose_data.landmarks_xy is not None:
+        return pose_data.landmarks_xy
+    landmarks = pose_data.landmarks
+    return np.array(
+        [landmarks[name].as_tuple() for name in PoseData.LANDMARK_INDEX],
+        dtype=np.int32
+    )
+
+
+@njit(cache=True)
+def _dashed_segments(x1: float, y1: float, x2: float, y2: float,
+                     dash_length: float, gap_length: float) -> np.ndarray:
+    """
+    Calculate the endpoints of the dashes of a dashed line.
+    
+    Returns:
+        (N, 2, 2) int32 array of dash start and end points
+    """
+    # Calculate line length and direction
+    dx, dy = x2 - x1, y2 - y1
+    dist = math.sqrt(dx * dx + dy * dy)
+    
+    # Normalize direction vector
+    if dist > 0:
+        dx, dy = dx / dist, dy / dist
+    
+    # Calculate number of segments
+    segment_length = dash_length + gap_length
+    num_segments = int(dist / segment_length)
+    
+    # Compute every dash's endpoints at once, truncating to integer pixels
+    start_dist = np.arange(num_segments) * segment_length
+    end_dist = np.minimum(start_dist + dash_length, dist)
+    segments = np.empty((num_segments, 2, 2), dtype=np.int32)
+    segments[:, 0, 0] = (x1 + dx * start_dist).astype(np.int32)
+    segments[:, 0, 1] = (y1 + dy * start_dist).astype(np.int32)
+    segments[:, 1, 0] = (x1 + dx * end_dist).astype(np.int32)
+    segments[:, 1, 1] = (y1 + dy * end_dist).astype(np.int32)
+    return segments
+
+
+# Compile the kernel at import time so the first drawn frame does not pay the JIT cost
+_dashed_segments(0.0, 0.0, 30.0, 0.0, 10.0, 5.0)
 
 
 class VisualCues:
@@ -29,9 +142,23 @@ class VisualCues:
         # Guidance line settings
         self.line_dash_length = 10
         self.line_gap_length = 5
+        self.target_line_thickness = 2
+        
+        # Target pose overlay buffer reused across frames instead of copying into a new array
+        self._overlay_buf: Optional[np.ndarray] = None
+        
+        # Rasterized arrow labels as (mask, x offset, y offset) relative to the text origin
+        self._label_masks: Dict[str, Tuple[np.ndarray, int, int]] = {}
+        for label in ARROW_LABELS:
+            self._label_mask(label)
+        
+        # Guidance text lines as (text, position), reused while the descriptions are unchanged
+        self._text_key: Optional[Tuple[str, ...]] = None
+        self._text_lines: List[Tuple[str, Tuple[int, int]]] = []
     
     def draw_adjustment_arrows(self, frame: np.ndarray, pose_data: PoseData, 
-                              adjustments: List[AdjustmentRecommendation]) -> np.ndarray:
+                              adjustments: List[AdjustmentRecommendation],
+                              in_place: bool = False) -> np.ndarray:
         """
         Draw directional arrows for suggested adjustments.
         
@@ -39,6 +166,7 @@ class VisualCues:
             frame: Input frame
             pose_data: Processed pose data
             adjustments: List of adjustment recommendations
+            in_place: Draw directly onto frame instead of a copy
             
         Returns:
             Frame with adjustment arrows
@@ -46,47 +174,84 @@ class VisualCues:
         if not adjustments:
             return frame
         
-        result_frame = frame.copy()
+        result_frame = frame if in_place else frame.copy()
         
-        # Group adjustments by component
-        component_adjustments = {}
+        # Find the highest priority adjustment for each component in a single pass
+        best_adjustments = {}
         for adjustment in adjustments:
-            component = adjustment.component
-            if component not in component_adjustments:
-                component_adjustments[component] = []
-            component_adjustments[component].append(adjustment)
+            current = best_adjustments.get(adjustment.component)
+            if current is None or adjustment.priority < current.priority:
+                best_adjustments[adjustment.component] = adjustment
         
-        # Draw arrows for each component
+        # Draw arrows for each component, positioned from its anchor landmark
         landmarks = pose_data.landmarks
-        for component, adj_list in component_adjustments.items():
-            # Get highest priority adjustment for this component
-            adjustment = min(adj_list, key=lambda x: x.priority)
+        for component, adjustment in best_adjustments.items():
+            anchor = ARROW_ANCHORS.get(component)
+            if anchor is None:
+                continue
             
-            # Determine arrow position based on component
-            if component == "saddle":
-                # Position arrow near hip
-                position = (landmarks["hip"].x, landmarks["hip"].y - 50)
-                self._draw_vertical_arrow(result_frame, position, adjustment.direction)
-                
-            elif component == "handlebar":
-                # Position arrow near hands/elbow
-                position = (landmarks["elbow"].x + 50, landmarks["elbow"].y)
-                if adjustment.direction in ["raise", "lower"]:
-                    self._draw_vertical_arrow(result_frame, position, adjustment.direction)
-                else:
-                    self._draw_horizontal_arrow(result_frame, position, adjustment.direction)
-                    
-            elif component == "stem":
-                # Position arrow near the handlebar/stem area
-                position = (landmarks["shoulder"].x + 80, landmarks["shoulder"].y - 30)
-                self._draw_horizontal_arrow(result_frame, position, adjustment.direction)
+            landmark_name, offset_x, offset_y, vertical = anchor
+            landmark = landmarks[landmark_name]
+            position = (landmark.x + offset_x, landmark.y + offset_y)
+            direction = adjustment.direction
+            if vertical is None:
+                vertical = direction in VERTICAL_DIRECTIONS
+            
+            if vertical:
+                self._draw_vertical_arrow(result_frame, position, direction)
+            else:
+                self._draw_horizontal_arrow(result_frame, position, direction)
         
         return result_frame
     
+    def _label_mask(self, text: str) -> Tuple[np.ndarray, int, int]:
+        """
+        Get the rasterized mask of an arrow label, rendering it on first use.
+        
+        Args:
+            text: Label text
+            
+        Returns:
+            Tuple of (boolean mask, x offset, y offset of its top-left corner from the text origin)
+        """
+        cached = self._label_masks.get(text)
+        if cached is not None:
+            return cached
+        
+        # Render the text once into a padded single-channel canvas; Hershey fonts without
+        # anti-aliasing give a binary mask, so blitting it inside the frame matches cv2.putText
+        (width, height), baseline = cv2.getTextSize(text, FONT, self.font_scale, self.text_thickness)
+        pad = self.text_thickness + 1
+        canvas = np.zeros((height + baseline + 2 * pad, width + 2 * pad), dtype=np.uint8)
+        cv2.putText(canvas, text, (pad, pad + height), FONT, self.font_scale, 255, self.text_thickness)
+        
+        cached = (canvas > 0, -pad, -(pad + height))
+        self._label_masks[text] = cached
+        return cached
+    
+    def _draw_label(self, frame: np.ndarray, text: str, origin: Tuple[int, int],
+                    color: Tuple[int, int, int]):
+        """
+        Draw an arrow label by blitting its pre-rendered mask.
+        
+        OpenCV clips glyph strokes at the frame border differently from a clipped
+        mask, so labels that cross the border are drawn with cv2.putText instead.
+        """
+        mask, offset_x, offset_y = self._label_mask(text)
+        x, y = origin[0] + offset_x, origin[1] + offset_y
+        mask_height, mask_width = mask.shape
+        frame_height, frame_width = frame.shape[:2]
+        
+        if x < 0 or y < 0 or x + mask_width > frame_width or y + mask_height > frame_height:
+            cv2.putText(frame, text, origin, FONT, self.font_scale, color, self.text_thickness)
+            return
+        
+        frame[y:y + mask_height, x:x + mask_width][mask] = color
+    
     def _draw_vertical_arrow(self, frame: np.ndarray, position: Tuple[int, int], direction: str):
         """Draw a vertical arrow."""
         x, y = position
-        if direction in ["up", "raise"]:
+        if direction in UP_DIRECTIONS:
             pt1 = (x, y + self.arrow_length // 2)
             pt2 = (x, y - self.arrow_length // 2)
         else:  # down, lower
@@ -102,20 +267,12 @@ class VisualCues:
         
         # Add text label
         text_position = (x + 10, y)
-        cv2.putText(
-            frame, 
-            direction.title(), 
-            text_position, 
-            FONT, 
-            self.font_scale, 
-            COLORS["text_color"], 
-            self.text_thickness
-        )
+        self._draw_label(frame, direction.title(), text_position, COLORS["text_color"])
     
     def _draw_horizontal_arrow(self, frame: np.ndarray, position: Tuple[int, int], direction: str):
         """Draw a horizontal arrow."""
         x, y = position
-        if direction in ["left", "shorten", "back"]:
+        if direction in LEFT_DIRECTIONS:
             pt1 = (x + self.arrow_length // 2, y)
             pt2 = (x - self.arrow_length // 2, y)
         else:  # right, extend, forward
@@ -131,141 +288,118 @@ class VisualCues:
         
         # Add text label
         text_position = (x, y - 10)
-        cv2.putText(
-            frame, 
-            direction.title(), 
-            text_position, 
-            FONT, 
-            self.font_scale, 
-            COLORS["text_color"], 
-            self.text_thickness
-        )
+        self._draw_label(frame, direction.title(), text_position, COLORS["text_color"])
     
-    def draw_target_pose_overlay(self, frame: np.ndarray, pose_data: PoseData) -> np.ndarray:
+    def draw_target_pose_overlay(self, frame: np.ndarray, pose_data: PoseData,
+                                 in_place: bool = False) -> np.ndarray:
         """
         Draw target pose overlay showing ideal positions.
         
         Args:
             frame: Input frame
             pose_data: Processed pose data
+            in_place: Draw directly onto frame instead of a copy
             
         Returns:
             Frame with target pose overlay
         """
-        result_frame = frame.copy()
-        
-        # Create a transparent overlay
-        overlay = result_frame.copy()
+        result_frame = frame if in_place else frame.copy()
         
         # Draw target pose - this is a simplified example
         # For each angle that's outside ideal range, draw a line showing the target position
         landmarks = pose_data.landmarks
         angles = pose_data.angles
         
-        for angle_type, angle in angles.items():
-            if angle_type in IDEAL_ANGLES and not angle.is_in_range(IDEAL_ANGLES):
-                min_val, max_val = IDEAL_ANGLES[angle_type]
-                
-                # Calculate target angle (mid-point of ideal range)
-                target_angle = (min_val + max_val) / 2
-                
-                # Draw the ideal angle line
-                if angle_type == "neck_angle":
-                    self._draw_target_angle_line(
-                        overlay, 
-                        landmarks["nose"], 
-                        landmarks["shoulder"], 
-                        target_angle,
-                        angle.value
-                    )
-                elif angle_type == "shoulder_angle":
-                    self._draw_target_angle_line(
-                        overlay, 
-                        landmarks["hip"], 
-                        landmarks["shoulder"], 
-                        target_angle,
-                        angle.value
-                    )
-                elif angle_type == "elbow_angle":
-                    self._draw_target_angle_line(
-                        overlay, 
-                        landmarks["shoulder"], 
-                        landmarks["elbow"], 
-                        target_angle,
-                        angle.value
-                    )
-                elif angle_type == "hip_angle":
-                    self._draw_target_angle_line(
-                        overlay, 
-                        landmarks["shoulder"], 
-                        landmarks["hip"], 
-                        target_angle,
-                        angle.value
-                    )
-                elif angle_type == "knee_angle":
-                    self._draw_target_angle_line(
-                        overlay, 
-                        landmarks["hip"], 
-                        landmarks["knee"], 
-                        target_angle,
-                        angle.value
-                    )
+        # Check all angles against their ideal ranges at once; missing angles become
+        # NaN, which compares false and is never drawn
+        values = np.fromiter(
+            (angles[name].value if name in angles else np.nan for name in TARGET_ANGLES),
+            dtype=np.float64, count=len(TARGET_ANGLES)
+        )
+        out_of_range = (values < IDEAL_MIN) | (values > IDEAL_MAX)
+        
+        # Work out the target lines first (towards the mid-point of the ideal range),
+        # so only the region they cover has to be copied and blended
+        lines = []
+        for i in np.flatnonzero(out_of_range).tolist():
+            end_point, vertex = TARGET_LINE_LANDMARKS[TARGET_ANGLES[i]]
+            target = self._target_line_end(
+                landmarks[end_point], 
+                landmarks[vertex], 
+                float(IDEAL_MID[i]),
+                float(values[i])
+            )
+            if target is not None:
+                lines.append((landmarks[vertex].as_tuple(), target))
+        if not lines:
+            return result_frame
+        
+        # Bounding box of the lines, padded by the line thickness and clipped to the frame
+        height, width = frame.shape[:2]
+        xs = [x for line in lines for x, _ in line]
+        ys = [y for line in lines for _, y in line]
+        x0 = max(min(xs) - self.target_line_thickness, 0)
+        y0 = max(min(ys) - self.target_line_thickness, 0)
+        x1 = min(max(xs) + self.target_line_thickness + 1, width)
+        y1 = min(max(ys) + self.target_line_thickness + 1, height)
+        if x0 >= x1 or y0 >= y1:
+            return result_frame
+        
+        # Create a transparent overlay of that region in a buffer reused across frames
+        if self._overlay_buf is None or self._overlay_buf.shape != frame.shape:
+            self._overlay_buf = np.empty_like(frame)
+        overlay = self._overlay_buf
+        np.copyto(overlay[y0:y1, x0:x1], result_frame[y0:y1, x0:x1])
+        
+        # Draw dashed lines to show the target positions
+        for start, end in lines:
+            self._draw_dashed_line(
+                overlay, 
+                start, 
+                end,
+                COLORS["highlight"],
+                thickness=self.target_line_thickness,
+                dash_length=self.line_dash_length,
+                gap_length=self.line_gap_length
+            )
         
         # Blend the overlay with the original frame
         alpha = 0.4  # Transparency factor
-        cv2.addWeighted(overlay, alpha, result_frame, 1 - alpha, 0, result_frame)
+        roi = result_frame[y0:y1, x0:x1]
+        cv2.addWeighted(overlay[y0:y1, x0:x1], alpha, roi, 1 - alpha, 0, roi)
         
         return result_frame
     
-    def _draw_target_angle_line(self, frame: np.ndarray, point_a: Point, point_b: Point, 
-                               target_angle: float, current_angle: float):
+    def _target_line_end(self, point_a: Point, point_b: Point, 
+                         target_angle: float, current_angle: float) -> Optional[Tuple[int, int]]:
         """
-        Draw a line showing the target angle.
+        Calculate the end point of the line showing the target angle.
         
         Args:
-            frame: Frame to draw on
             point_a: First point
             point_b: Vertex point
             target_angle: Target angle in degrees
             current_angle: Current angle in degrees
+            
+        Returns:
+            End point of the target line starting at point_b, or None if the points coincide
         """
-        # Convert points to numpy arrays
-        a = np.array([point_a.x, point_a.y])
-        b = np.array([point_b.x, point_b.y])
-        
-        # Calculate distance for line length
-        dist = np.linalg.norm(a - b)
+        # Calculate direction vector from b to a, and its length
+        bx, by = point_b.x, point_b.y
+        dir_x, dir_y = point_a.x - bx, point_a.y - by
+        dist = math.hypot(dir_x, dir_y)
+        if dist == 0:
+            return None
         line_length = min(100, dist)
         
-        # Calculate direction vector from b to a
-        dir_vector = a - b
-        dir_vector = dir_vector / np.linalg.norm(dir_vector)
-        
-        # Calculate angle adjustment needed
-        angle_diff = target_angle - current_angle
-        
-        # Rotate the direction vector by the angle difference
-        angle_rad = np.radians(angle_diff)
-        rotation_matrix = np.array([
-            [np.cos(angle_rad), -np.sin(angle_rad)],
-            [np.sin(angle_rad), np.cos(angle_rad)]
-        ])
-        
-        rotated_vector = np.dot(rotation_matrix, dir_vector)
+        # Rotate the unit direction by the angle adjustment needed (rounded to 0.1
+        # degrees so the rotation can be reused across frames)
+        cos_a, sin_a = _rotation(round(target_angle - current_angle, 1))
+        rotated_x = (cos_a * dir_x - sin_a * dir_y) / dist
+        rotated_y = (sin_a * dir_x + cos_a * dir_y) / dist
         
         # Calculate target point
-        target_point = b + rotated_vector * line_length
-        
-        # Draw dashed line to show target position
-        self._draw_dashed_line(
-            frame, 
-            (int(b[0]), int(b[1])), 
-            (int(target_point[0]), int(target_point[1])),
-            COLORS["highlight"],
-            thickness=2,
-            dash_length=self.line_dash_length,
-            gap_length=self.line_gap_length
-        )
+        return (int(bx + rotated_x * line_length), int(by + rotated_y * line_length))
     
     def _draw_dashed_line(self, frame: np.ndarray, pt1: Tuple[int, int], pt2: Tuple[int, int], 
                          color: Tuple[int, int, int], thickness: int = 1, 
@@ -282,36 +416,19 @@ class VisualCues:
             dash_length: Length of each dash
             gap_length: Length of each gap
         """
-        x1, y1 = pt1
-        x2, y2 = pt2
-        
-        # Calculate line length and direction
-        dx, dy = x2 - x1, y2 - y1
-        dist = math.sqrt(dx * dx + dy * dy)
-        
-        # Normalize direction vector
-        if dist > 0:
-            dx, dy = dx / dist, dy / dist
-        
-        # Calculate number of segments
-        segment_length = dash_length + gap_length
-        num_segments = int(dist / segment_length)
+        segments = _dashed_segments(
+            float(pt1[0]), float(pt1[1]), float(pt2[0]), float(pt2[1]),
+            float(dash_length), float(gap_length)
+        )
+        if len(segments) == 0:
+            return
         
-        # Draw dashed line
-        for i in range(num_segments):
-            start_dist = i * segment_length
-            end_dist = start_dist + dash_length
-            
-            start_x = int(x1 + dx * start_dist)
-            start_y = int(y1 + dy * start_dist)
-            
-            end_x = int(x1 + dx * min(end_dist, dist))
-            end_y = int(y1 + dy * min(end_dist, dist))
-            
-            cv2.line(frame, (start_x, start_y), (end_x, end_y), color, thickness)
+        # Draw all dashes in a single call
+        cv2.polylines(frame, segments, False, color, thickness)
     
     def draw_guidance_text(self, frame: np.ndarray, pose_data: PoseData, 
-                          adjustments: List[AdjustmentRecommendation]) -> np.ndarray:
+                          adjustments: List[AdjustmentRecommendation],
+                          in_place: bool = False) -> np.ndarray:
         """
         Draw guidance text on the frame.
         
@@ -319,6 +436,7 @@ class VisualCues:
             frame: Input frame
             pose_data: Processed pose data
             adjustments: List of adjustment recommendations
+            in_place: Draw directly onto frame instead of a copy
             
         Returns:
             Frame with guidance text
@@ -326,21 +444,54 @@ class VisualCues:
         if not adjustments:
             return frame
         
-        result_frame = frame.copy()
+        result_frame = frame if in_place else frame.copy()
+        
+        # Format the top 3 recommendations only when they change between frames
+        key = tuple(adjustment.description for adjustment in adjustments[:3])
+        if key != self._text_key:
+            y_offset = 30
+            self._text_lines = [
+                (f"{i+1}. {description}", (10, y_offset + i * 30))
+                for i, description in enumerate(key)
+            ]
+            self._text_key = key
         
         # Draw main guidance text in the corner
-        y_offset = 30
-        for i, adjustment in enumerate(adjustments[:3]):  # Show top 3 recommendations
-            text = f"{i+1}. {adjustment.description}"
-            cv2.putText(
-                result_frame, 
-                text, 
-                (10, y_offset + i * 30), 
-                FONT, 
-                0.6, 
-                COLORS["text_color"], 
-                2
-            )
+        color = COLORS["text_color"]
+        for text, position in self._text_lines:
+            cv2.putText(result_frame, text, position, FONT, 0.6, color, 2)
+        
+        return result_frame
+    
+    def apply_all_guidance_cues(self, frame: np.ndarray, pose_data: PoseData,
+                                adjustments: List[AdjustmentRecommendation],
+                                show_arrows: bool = True, show_target_pose: bool = True,
+                                show_text: bool = True, in_place: bool = False) -> np.ndarray:
+        """
+        Draw all enabled guidance cues on the frame.
+        
+        The frame is copied at most once and every cue is drawn onto that copy.
+        
+        Args:
+            frame: Input frame
+            pose_data: Processed pose data
+            adjustments: List of adjustment recommendations
+            show_arrows: Whether to draw adjustment arrows
+            show_target_pose: Whether to draw the target pose overlay
+            show_text: Whether to draw the guidance text
+            in_place: Draw directly onto frame instead of a copy
+            
+        Returns:
+            Frame with guidance cues
+        """
+        result_frame = frame if in_place else frame.copy()
+        
+        if show_target_pose:
+            self.draw_target_pose_overlay(result_frame, pose_data, in_place=True)
+        if show_arrows:
+            self.draw_adjustment_arrows(result_frame, pose_data, adjustments, in_place=True)
+        if show_text:
+            self.draw_guidance_text(result_frame, pose_data, adjustments, in_place=True)
         
         return result_frame
     
@@ -355,80 +506,66 @@ class VisualCues:
             view_mode: Visualization mode (normal_view, skeleton_only, angles_only, guidance_view, comparison_view)
             
         Returns:
-            Enhanced visualization frame
+            Enhanced visualization frame; the input frame itself when the view mode
+            adds nothing to it (e.g. normal_view)
         """
-        result_frame = frame.copy()
+        # Modes without extra drawing return the frame as is; the others allocate
+        # their own output frame below
+        result_frame = frame
         
         if view_mode == "skeleton_only":
             # Create a black background
             result_frame = np.zeros_like(frame)
             
             # Draw only the skeleton with high contrast colors
-            landmarks = pose_data.landmarks
+            points = _landmark_array(pose_data)
             
             # Draw key points
-            for point in landmarks.values():
+            for point in points.tolist():
                 cv2.circle(
                     result_frame, 
-                    point.as_tuple(), 
+                    tuple(point), 
                     8, 
                     (0, 255, 255), 
                     -1
                 )
             
-            # Draw connections
-            connections = [
-                (landmarks["nose"], landmarks["shoulder"]),
-                (landmarks["shoulder"], landmarks["elbow"]),
-                (landmarks["elbow"], landmarks["wrist"]),
-                (landmarks["shoulder"], landmarks["hip"]),
-                (landmarks["hip"], landmarks["knee"]),
-                (landmarks["knee"], landmarks["ankle"])
-            ]
-            
-            for start_point, end_point in connections:
-                cv2.line(
-                    result_frame, 
-                    start_point.as_tuple(), 
-                    end_point.as_tuple(), 
-                    (0, 255, 0), 
-                    3
-                )
+            # Draw all connections as (6, 2, 2) segments in a single call
+            cv2.polylines(result_frame, points[SKELETON_SEGMENTS], False, (0, 255, 0), 3)
         
         elif view_mode == "angles_only":
             # Create a dark background
             result_frame = np.zeros_like(frame)
             
             # Draw only the angles with high contrast
-            for angle_type, angle in pose_data.angles.items():
-                point_a = angle.point_a.as_tuple()
-                point_b = angle.point_b.as_tuple()
-                point_c = angle.point_c.as_tuple()
+            angles = pose_data.angles
+            if angles:
+                # Gather every angle's (a, b, c) points into a (K, 3, 2) array and draw
+                # both arms of all angles as open polylines in a single call
+                rows = np.array([ANGLE_POINT_ROWS[angle_type] for angle_type in angles], dtype=np.intp)
+                triangles = _landmark_array(pose_data)[rows]
+                cv2.polylines(result_frame, triangles, False, (0, 255, 0), 2)
                 
-                # Draw lines
-                cv2.line(result_frame, point_a, point_b, (0, 255, 0), 2)
-                cv2.line(result_frame, point_b, point_c, (0, 255, 0), 2)
+                # Place each angle's text at the centroid of its points
+                centers = (triangles.sum(axis=1) // 3).tolist()
                 
-                # Calculate position for the angle text
-                text_x = (point_a[0] + point_b[0] + point_c[0]) // 3
-                text_y = (point_a[1] + point_b[1] + point_c[1]) // 3
-                
-                # Draw angle value
-                cv2.putText(
-                    result_frame, 
-                    f"{angle_type}: {angle.value:.1f}deg", 
-                    (text_x, text_y), 
-                    FONT, 
-                    0.8, 
-                    (255, 255, 0), 
-                    2
-                )
+                for (angle_type, angle), center in zip(angles.items(), centers):
+                    # Draw angle value
+                    cv2.putText(
+                        result_frame, 
+                        f"{angle_type}: {angle.value:.1f}deg", 
+                        tuple(center), 
+                        FONT, 
+                        0.8, 
+                        (255, 255, 0), 
+                        2
+                    )
         
         elif view_mode == "guidance_view" and hasattr(self, 'adjustments') and self.adjustments:
             # Enhanced visualization with visual guidance
             # This would use the apply_all_guidance_cues method for comprehensive guidance
             result_frame = self.apply_all_guidance_cues(
-                result_frame,
+                frame,
                 pose_data,
                 self.adjustments,
                 show_arrows=True,
@@ -437,6 +574,8 @@ class VisualCues:
             )
         
         elif view_mode == "comparison_view":
+            result_frame = frame.copy()
+            
             # Split the frame into before/after sections
             h, w = result_frame.shape[:2]
             
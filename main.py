@@ -2,37 +2,66 @@
 Main entry point for the Bike Fit Analyzer application.
 Launches the GUI interface for the application.
 """
+import argparse
+import importlib.util
 import sys
 import os
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtGui import QIcon
 
-from bike_fit_analyzer.ui.main_window import MainWindow
+# Modules that must be installed; checked without importing them, since loading
+# OpenCV, MediaPipe and Qt is the bulk of the startup time
+REQUIRED_MODULES = ("cv2", "mediapipe", "numpy", "PyQt5")
 
 
 def check_dependencies():
     """Check that all required dependencies are installed."""
-    try:
-        import cv2
-        import mediapipe
-        import numpy as np
-        from PyQt5.QtWidgets import QApplication
-    except ImportError as e:
-        print(f"Error: Missing required dependency - {e}")
+    missing = [name for name in REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"Error: Missing required dependency - {', '.join(missing)}")
         print("Please install all dependencies with: pip install -r requirements.txt")
         return False
     
     return True
 
 
+def parse_args(argv):
+    """
+    Parse command line arguments.
+    
+    Args:
+        argv: Command line arguments, including the program name
+        
+    Returns:
+        Tuple of (parsed arguments, remaining arguments for Qt)
+    """
+    parser = argparse.ArgumentParser(description="Bicycle fit analysis and guidance using computer vision")
+    parser.add_argument(
+        "--complexity",
+        type=int,
+        choices=[0, 1, 2],
+        help="Pose model complexity (0 = fastest, 2 = most accurate)"
+    )
+    args, qt_args = parser.parse_known_args(argv[1:])
+    return args, argv[:1] + qt_args
+
+
 def main():
     """Main entry point for the application."""
     # Check dependencies
     if not check_dependencies():
         return 1
     
+    # Heavy GUI and vision modules are only loaded once they are known to be available
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtGui import QIcon
+    from bike_fit_analyzer.ui.main_window import MainWindow
+    from bike_fit_analyzer.config.settings_manager import settings_manager
+    
+    args, qt_args = parse_args(sys.argv)
+    if args.complexity is not None:
+        settings_manager.set("pose_model_complexity", args.complexity)
+    
     # Create and start the application
-    app = QApplication(sys.argv)
+    app = QApplication(qt_args)
     app.setApplicationName("Bike Fit Analyzer")
     
     # Set app icon if available
@@ -2,12 +2,16 @@
 Data models for angle-related data structures.
 """
 from dataclasses import dataclass
-from typing import Tuple, Dict, List
+from typing import ClassVar, Tuple, Dict, List, Optional
+
+import numpy as np
 
 
 @dataclass
 class Point:
     """Represents a 2D point with x, y coordinates."""
+    __slots__ = ("x", "y")
+    
     x: int
     y: int
     
@@ -19,6 +23,8 @@ class Point:
 @dataclass
 class Angle:
     """Represents an angle with value and type."""
+    __slots__ = ("value", "angle_type", "point_a", "point_b", "point_c")
+    
     value: float
     angle_type: str
     point_a: Point
@@ -35,9 +41,22 @@ class Angle:
 
 @dataclass
 class PoseData:
-    """Represents processed pose data with landmarks and angles."""
+    """
+    Represents processed pose data with landmarks and angles.
+    
+    Besides the Point mapping, the landmark coordinates are kept in a single
+    (N, 2) int32 array, ordered as LANDMARK_INDEX, for vectorized consumers.
+    """
+    # Row of each landmark in landmarks_xy
+    LANDMARK_INDEX: ClassVar[Dict[str, int]] = {
+        name: row for row, name in enumerate(
+            ("nose", "shoulder", "elbow", "wrist", "hip", "knee", "ankle")
+        )
+    }
+    
     landmarks: Dict[str, Point]
     angles: Dict[str, Angle]
+    landmarks_xy: Optional[np.ndarray] = None
     
     @property
     def angle_values(self) -> Dict[str, float]:
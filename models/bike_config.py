@@ -1,14 +1,21 @@
 """
 Bike configuration data model.
 """
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, asdict, field, fields
 from typing import Dict, List, Optional, Any
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 @dataclass
 class BikeType:
     """Represents a type of bike with default fit parameters."""
+    __slots__ = ("name", "default_angles", "description")
     
     name: str
     default_angles: Dict[str, tuple]
@@ -16,64 +23,68 @@ class BikeType:
     
     @classmethod
     def get_bike_types(cls) -> Dict[str, 'BikeType']:
-        """Get a dictionary of available bike types."""
-        return {
-            "road": cls(
-                name="Road Bike",
-                default_angles={
-                    "neck_angle": (65, 75),
-                    "shoulder_angle": (70, 90),
-                    "hip_angle": (65, 75),
-                    "knee_angle": (145, 155),
-                    "elbow_angle": (155, 165)
-                },
-                description="Performance-oriented road cycling position."
-            ),
-            "mtb": cls(
-                name="Mountain Bike",
-                default_angles={
-                    "neck_angle": (70, 80),
-                    "shoulder_angle": (80, 100),
-                    "hip_angle": (75, 85),
-                    "knee_angle": (135, 145),
-                    "elbow_angle": (145, 155)
-                },
-                description="More upright position for off-road control."
-            ),
-            "hybrid": cls(
-                name="Hybrid/City Bike",
-                default_angles={
-                    "neck_angle": (75, 85),
-                    "shoulder_angle": (90, 110),
-                    "hip_angle": (80, 100),
-                    "knee_angle": (135, 145),
-                    "elbow_angle": (145, 155)
-                },
-                description="Comfortable upright position for city riding."
-            ),
-            "tt": cls(
-                name="Time Trial/Triathlon Bike",
-                default_angles={
-                    "neck_angle": (55, 65),
-                    "shoulder_angle": (60, 80),
-                    "hip_angle": (55, 65),
-                    "knee_angle": (145, 155),
-                    "elbow_angle": (155, 165)
-                },
-                description="Aggressive aerodynamic position for time trials."
-            ),
-            "gravel": cls(
-                name="Gravel Bike",
-                default_angles={
-                    "neck_angle": (68, 78),
-                    "shoulder_angle": (75, 95),
-                    "hip_angle": (70, 80),
-                    "knee_angle": (140, 150),
-                    "elbow_angle": (150, 160)
-                },
-                description="Balanced position for mixed-terrain riding."
-            )
-        }
+        """Get a dictionary of available bike types (shared, do not modify)."""
+        return _BIKE_TYPES
+
+
+# Available bike types, built once at import
+_BIKE_TYPES: Dict[str, BikeType] = {
+    "road": BikeType(
+        name="Road Bike",
+        default_angles={
+            "neck_angle": (65, 75),
+            "shoulder_angle": (70, 90),
+            "hip_angle": (65, 75),
+            "knee_angle": (145, 155),
+            "elbow_angle": (155, 165)
+        },
+        description="Performance-oriented road cycling position."
+    ),
+    "mtb": BikeType(
+        name="Mountain Bike",
+        default_angles={
+            "neck_angle": (70, 80),
+            "shoulder_angle": (80, 100),
+            "hip_angle": (75, 85),
+            "knee_angle": (135, 145),
+            "elbow_angle": (145, 155)
+        },
+        description="More upright position for off-road control."
+    ),
+    "hybrid": BikeType(
+        name="Hybrid/City Bike",
+        default_angles={
+            "neck_angle": (75, 85),
+            "shoulder_angle": (90, 110),
+            "hip_angle": (80, 100),
+            "knee_angle": (135, 145),
+            "elbow_angle": (145, 155)
+        },
+        description="Comfortable upright position for city riding."
+    ),
+    "tt": BikeType(
+        name="Time Trial/Triathlon Bike",
+        default_angles={
+            "neck_angle": (55, 65),
+            "shoulder_angle": (60, 80),
+            "hip_angle": (55, 65),
+            "knee_angle": (145, 155),
+            "elbow_angle": (155, 165)
+        },
+        description="Aggressive aerodynamic position for time trials."
+    ),
+    "gravel": BikeType(
+        name="Gravel Bike",
+        default_angles={
+            "neck_angle": (68, 78),
+            "shoulder_angle": (75, 95),
+            "hip_angle": (70, 80),
+            "knee_angle": (140, 150),
+            "elbow_angle": (150, 160)
+        },
+        description="Balanced position for mixed-terrain riding."
+    )
+}
 
 
 @dataclass
@@ -106,8 +117,12 @@ class BikeConfig:
         Args:
             file_path: Path to save the file
         """
-        with open(file_path, 'w') as f:
-            json.dump(asdict(self), f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(self, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(asdict(self), f, indent=2)
     
     def load_from_file(self, file_path: str):
         """
@@ -116,31 +131,40 @@ class BikeConfig:
         Args:
             file_path: Path to the file to load
         """
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            
-            # Update instance attributes
-            for key, value in data.items():
-                if hasattr(self, key):
-                    setattr(self, key, value)
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        
+        # Update instance attributes, ignoring keys that are not fields
+        for key, value in data.items():
+            if key in _BIKE_CONFIG_FIELDS:
+                setattr(self, key, value)
     
     def get_angle_ranges(self) -> Dict[str, tuple]:
         """
         Get the angle ranges for this bike configuration.
         
         Returns:
-            Dictionary of angle ranges
+            Dictionary of angle ranges (the shared bike type defaults when there are
+            no custom angles, so callers must not modify it)
         """
         # Get default angles for the bike type
-        bike_types = BikeType.get_bike_types()
-        if self.bike_type in bike_types:
-            default_angles = bike_types[self.bike_type].default_angles
-        else:
+        bike_type = _BIKE_TYPES.get(self.bike_type)
+        if bike_type is None:
             # Fallback to road bike defaults
-            default_angles = bike_types["road"].default_angles
+            bike_type = _BIKE_TYPES["road"]
+        default_angles = bike_type.default_angles
+        
+        # Without custom angles the defaults apply unchanged
+        if not self.custom_angles:
+            return default_angles
         
         # Override with custom angles
         angle_ranges = default_angles.copy()
         angle_ranges.update(self.custom_angles)
         
-        return angle_ranges
\ No newline at end of file
+        return angle_ranges
+
+
+# Names of the fields restored by load_from_file
+_BIKE_CONFIG_FIELDS = frozenset(f.name for f in fields(BikeConfig))
@@ -2,9 +2,15 @@
 User profile data model for storing user measurements and preferences.
 """
 import json
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, asdict, field, fields
 from typing import Dict, List, Optional, Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 @dataclass
 class UserProfile:
@@ -44,8 +50,12 @@ class UserProfile:
         Args:
             file_path: Path to save the file
         """
-        with open(file_path, 'w') as f:
-            json.dump(asdict(self), f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(self, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(asdict(self), f, indent=2)
     
     def load_from_file(self, file_path: str):
         """
@@ -54,13 +64,14 @@ class UserProfile:
         Args:
             file_path: Path to the file to load
         """
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            
-            # Update instance attributes
-            for key, value in data.items():
-                if hasattr(self, key):
-                    setattr(self, key, value)
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        
+        # Update instance attributes, ignoring keys that are not fields
+        for key, value in data.items():
+            if key in _USER_PROFILE_FIELDS:
+                setattr(self, key, value)
     
     def add_fit_session(self, session_data: Dict[str, Any]):
         """
@@ -75,3 +86,7 @@ class UserProfile:
             session_data["timestamp"] = datetime.now().isoformat()
             
         self.fit_history.append(session_data)
+
+
+# Names of the fields restored by load_from_file
+_USER_PROFILE_FIELDS = frozenset(f.name for f in fields(UserProfile))
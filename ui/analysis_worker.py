@@ -0,0 +1,80 @@
+"""
+Background pose analysis for the Bike Fit Analyzer.
+"""
+import threading
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+from PyQt5.QtCore import QThread, pyqtSignal
+
+if TYPE_CHECKING:
+    from bike_fit_analyzer.core.analyzer import BikeFitAnalyzer
+
+
+class AnalysisWorker(QThread):
+    """
+    Runs pose analysis on a background thread at its own pace.
+    
+    Frames are handed over through a single slot: submitting a frame replaces
+    any frame that has not been picked up yet, so analysis always works on the
+    latest frame and a slow model drops frames instead of queueing them. The
+    GUI keeps displaying camera frames at capture rate with the most recent
+    results overlaid.
+    """
+    
+    # Emitted with the pose data, adjustments and MediaPipe landmarks of each analyzed frame
+    analysisReady = pyqtSignal(object, object, object)
+    
+    def __init__(self, analyzer: "BikeFitAnalyzer", parent=None):
+        """
+        Initialize the analysis worker.
+        
+        Args:
+            analyzer: Analyzer to run; only this thread uses it while running
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self.analyzer = analyzer
+        
+        # Single-slot frame buffer shared with the GUI thread
+        self._condition = threading.Condition()
+        self._frame: Optional[np.ndarray] = None
+    
+    def submit(self, frame: np.ndarray):
+        """
+        Hand the worker a new frame, replacing any frame still waiting.
+        
+        Args:
+            frame: BGR frame to analyze (only read, never drawn on)
+        """
+        with self._condition:
+            self._frame = frame
+            self._condition.notify()
+    
+    def stop(self):
+        """Stop the worker and wait for the frame in progress to finish."""
+        with self._condition:
+            self.requestInterruption()
+            self._condition.notify()
+        self.wait()
+    
+    def run(self):
+        """Analyze submitted frames until stopped."""
+        while True:
+            with self._condition:
+                while self._frame is None and not self.isInterruptionRequested():
+                    self._condition.wait()
+                if self.isInterruptionRequested():
+                    return
+                frame, self._frame = self._frame, None
+            
+            try:
+                # The frame was mirrored by the GUI and is shared with the display,
+                # so leave it untouched; the display draws the landmark overlay itself
+                _, pose_data, adjustments = self.analyzer.process_frame(frame, show_landmarks=False)
+                pose_landmarks = self.analyzer.pose_detector.last_pose_landmarks if pose_data else None
+            except Exception as e:
+                print(f"Error processing frame: {e}")
+                continue
+            
+            self.analysisReady.emit(pose_data, adjustments, pose_landmarks)
@@ -0,0 +1,62 @@
+"""
+Background camera capture for the Bike Fit Analyzer.
+"""
+import threading
+
+import cv2
+import numpy as np
+from PyQt5.QtCore import QThread, pyqtSignal
+
+
+class CameraWorker(QThread):
+    """
+    Reads camera frames on a background thread and hands them to the GUI.
+    
+    Capture blocks on the camera's frame rate, so running it off the GUI thread
+    keeps the window responsive and overlaps reading the next frame with
+    analyzing the current one. At most one frame is in flight: frames read
+    while the GUI is still busy with the previous one are dropped, so a slow
+    analysis step shows the latest frame instead of building up a backlog.
+    """
+    
+    # Emitted with each captured BGR frame
+    frameReady = pyqtSignal(np.ndarray)
+    
+    # Emitted when a frame could not be read
+    captureFailed = pyqtSignal()
+    
+    # Pause after a failed read before trying again (ms)
+    RETRY_DELAY_MS = 30
+    
+    def __init__(self, camera: cv2.VideoCapture, parent=None):
+        """
+        Initialize the camera worker.
+        
+        Args:
+            camera: Opened camera to read from; only this thread reads it while running
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self.camera = camera
+        
+        # Set while no emitted frame is waiting for the GUI
+        self._consumed = threading.Event()
+        self._consumed.set()
+    
+    def frame_consumed(self):
+        """Tell the worker the GUI has finished with the last emitted frame."""
+        self._consumed.set()
+    
+    def run(self):
+        """Capture frames until interruption is requested."""
+        while not self.isInterruptionRequested():
+            ret, frame = self.camera.read()
+            if not ret:
+                self.captureFailed.emit()
+                self.msleep(self.RETRY_DELAY_MS)
+                continue
+            
+            # Drop the frame if the GUI has not finished with the previous one
+            if self._consumed.is_set():
+                self._consumed.clear()
+                self.frameReady.emit(frame)
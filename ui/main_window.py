@@ -2,23 +2,21 @@
 Main application window for the Bike Fit Analyzer.
 Implements a PyQt-based GUI that integrates all components.
 """
-import sys
+from functools import cached_property
+
 import cv2
 import numpy as np
-from typing import Optional
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QComboBox, QStatusBar, QAction, QToolBar,
-    QDockWidget, QTabWidget, QMessageBox, QFileDialog, QSplitter
+    QMainWindow, QWidget, QHBoxLayout, QStatusBar, QAction, QToolBar,
+    QMessageBox, QFileDialog, QSplitter
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSlot, pyqtSignal, QSize
-from PyQt5.QtGui import QPixmap, QImage, QIcon
+from PyQt5.QtCore import Qt, pyqtSlot, QSize
 
 from bike_fit_analyzer.ui.settings_panel import SettingsPanel
 from bike_fit_analyzer.ui.visualization_panel import VisualizationPanel
-from bike_fit_analyzer.core.analyzer import BikeFitAnalyzer
+from bike_fit_analyzer.ui.camera_worker import CameraWorker
+from bike_fit_analyzer.ui.analysis_worker import AnalysisWorker
 from bike_fit_analyzer.utils.camera import CameraManager
-from bike_fit_analyzer.wizard.setup_wizard import SetupWizard
 from bike_fit_analyzer.models.user_profile import UserProfile
 from bike_fit_analyzer.config.settings_manager import settings_manager
 
@@ -30,26 +28,40 @@ class MainWindow(QMainWindow):
         """Initialize the main window."""
         super().__init__()
         
-        # Initialize application components
-        self.analyzer = BikeFitAnalyzer()
+        # Initialize application components (the analyzer is created on first use)
         self.camera_manager = CameraManager()
         self.user_profile = UserProfile()
         
         # Camera and video processing variables
         self.camera = None
         self.camera_id = settings_manager.get("camera_id", 0)
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_frame)
+        self.camera_worker = None
+        self.analysis_worker = None
         self.mirror_enabled = settings_manager.get("mirror_enabled", True)
         
+        # Results of the most recently analyzed frame
+        self.pose_data = None
+        self.adjustments = None
+        self.pose_landmarks = None
+        
         # Setup the UI
         self.init_ui()
         
         # Connect signals and slots
         self.connect_signals()
         
-        # Register as settings observer
-        settings_manager.add_observer(self._on_settings_changed)
+        # Register for the settings this window reacts to
+        settings_manager.add_observer("camera_id", self._on_camera_id_changed)
+        settings_manager.add_observer("mirror_enabled", self._on_mirror_changed)
+        settings_manager.add_observer("pose_model_complexity", self._on_model_complexity_changed)
+    
+    @cached_property
+    def analyzer(self):
+        """Pose analyzer, created when the camera first starts."""
+        # Imported here so the window opens without waiting for MediaPipe to load
+        from bike_fit_analyzer.core.analyzer import BikeFitAnalyzer
+        
+        return BikeFitAnalyzer(settings_manager.get("pose_model_complexity"))
     
     def init_ui(self):
         """Initialize the user interface."""
@@ -203,20 +215,33 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     def start_camera(self):
         """Start the camera capture."""
-        if self.timer.isActive():
+        if self.camera_worker is not None:
             return
         
         # Get selected camera ID from settings panel
         self.camera_id = self.settings_panel.get_selected_camera_id()
         
         # Open the camera
-        self.camera = self.camera_manager.open_camera(self.camera_id)
+        self.camera = self.camera_manager.open_camera(
+            self.camera_id,
+            settings_manager.get("camera_width"),
+            settings_manager.get("camera_height")
+        )
         if self.camera is None:
             QMessageBox.critical(self, "Error", f"Failed to open camera {self.camera_id}")
             return
         
-        # Start the timer for frame updates
-        self.timer.start(30)  # Update every 30ms (approx. 33 FPS)
+        # Capture frames on a background thread; frames are delivered to update_frame
+        # through the GUI thread's event loop
+        self.camera_worker = CameraWorker(self.camera, self)
+        self.camera_worker.frameReady.connect(self.update_frame, Qt.QueuedConnection)
+        self.camera_worker.captureFailed.connect(self._on_capture_failed, Qt.QueuedConnection)
+        self.camera_worker.start()
+        
+        # Analyze frames on a second thread so slow inference never holds up the display
+        self.analysis_worker = AnalysisWorker(self.analyzer, self)
+        self.analysis_worker.analysisReady.connect(self._on_analysis_ready, Qt.QueuedConnection)
+        self.analysis_worker.start()
         self.status_bar.showMessage(f"Camera {self.camera_id} started")
         
         # Update button states
@@ -225,11 +250,16 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     def stop_camera(self):
         """Stop the camera capture."""
-        if not self.timer.isActive():
+        if self.camera_worker is None:
             return
         
-        # Stop the timer
-        self.timer.stop()
+        # Stop the capture thread before releasing the camera it reads from
+        self.camera_worker.requestInterruption()
+        self.camera_worker.wait()
+        self.camera_worker = None
+        self.analysis_worker.stop()
+        self.analysis_worker = None
+        self._clear_analysis_results()
         
         # Release the camera
         if self.camera is not None:
@@ -254,7 +284,7 @@ class MainWindow(QMainWindow):
         self.camera_id = self.settings_panel.get_selected_camera_id()
         
         # If camera is running, restart it with the new ID
-        if self.timer.isActive():
+        if self.camera_worker is not None:
             self.stop_camera()
             self.start_camera()
     
@@ -265,38 +295,69 @@ class MainWindow(QMainWindow):
         self.settings_panel.update_mirror_button(self.mirror_enabled)
         self.status_bar.showMessage(f"Mirror mode: {'On' if self.mirror_enabled else 'Off'}")
     
+    @pyqtSlot(np.ndarray)
+    def update_frame(self, frame):
+        """
+        Display a frame delivered by the camera worker and queue it for analysis.
+        
+        Args:
+            frame: BGR frame captured from the camera
+        """
+        # Ignore frames still queued from a worker that has been stopped
+        if self.camera_worker is None:
+            return
+        
+        try:
+            # Mirror the frame in place if requested
+            if self.mirror_enabled:
+                cv2.flip(frame, 1, dst=frame)
+            
+            if self.settings_panel.is_analysis_active():
+                # Queue the frame for analysis and show it with the latest results
+                self.analysis_worker.submit(frame)
+                self.visualization_panel.update_frame(
+                    frame, self.pose_data, self.adjustments, self.pose_landmarks
+                )
+            else:
+                # Just show the frame
+                self.visualization_panel.update_frame(frame)
+        finally:
+            # Let the worker deliver the next frame
+            if self.camera_worker is not None:
+                self.camera_worker.frame_consumed()
+    
+    @pyqtSlot(object, object, object)
+    def _on_analysis_ready(self, pose_data, adjustments, pose_landmarks):
+        """
+        Store the results of the most recently analyzed frame.
+        
+        Args:
+            pose_data: Pose data of the analyzed frame, or None if no pose was found
+            adjustments: Adjustment recommendations, or None if guidance is off
+            pose_landmarks: MediaPipe landmarks of the analyzed frame, or None
+        """
+        # Discard results that arrive after analysis was stopped
+        if not self.settings_panel.is_analysis_active():
+            return
+        
+        self.pose_data = pose_data
+        self.adjustments = adjustments
+        self.pose_landmarks = pose_landmarks
+    
+    def _clear_analysis_results(self):
+        """Forget the latest analysis results."""
+        self.pose_data = None
+        self.adjustments = None
+        self.pose_landmarks = None
+    
     @pyqtSlot()
-    def update_frame(self):
-        """Update the video frame from the camera."""
+    def _on_capture_failed(self):
+        """Report a failed capture, stopping the camera if it was disconnected."""
         if self.camera is None or not self.camera.isOpened():
             self.stop_camera()
             return
         
-        # Read a frame from the camera
-        ret, frame = self.camera.read()
-        if not ret:
-            self.status_bar.showMessage("Failed to capture frame")
-            return
-        
-        # Process the frame if analysis is active
-        if self.settings_panel.is_analysis_active():
-            try:
-                processed_frame, pose_data, adjustments = self.analyzer.process_frame(frame, self.mirror_enabled)
-                # Update the visualization panel with the new frame and data
-                self.visualization_panel.update_frame(processed_frame, pose_data, adjustments)
-            except Exception as e:
-                print(f"Error processing frame: {e}")
-                # If there's an error, just show the mirrored frame
-                if self.mirror_enabled:
-                    frame = cv2.flip(frame, 1)
-                self.visualization_panel.update_frame(frame)
-        elif self.mirror_enabled:
-            # Just mirror the frame without analysis
-            frame = cv2.flip(frame, 1)
-            self.visualization_panel.update_frame(frame)
-        else:
-            # Just show the raw frame
-            self.visualization_panel.update_frame(frame)
+        self.status_bar.showMessage("Failed to capture frame")
     
     @pyqtSlot()
     def start_analysis(self):
@@ -308,6 +369,7 @@ class MainWindow(QMainWindow):
     def stop_analysis(self):
         """Stop the pose analysis."""
         self.settings_panel.set_analysis_active(False)
+        self._clear_analysis_results()
         self.status_bar.showMessage("Analysis stopped")
     
     @pyqtSlot()
@@ -330,6 +392,8 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     def run_setup_wizard(self):
         """Launch the setup wizard."""
+        from bike_fit_analyzer.wizard.setup_wizard import SetupWizard
+        
         wizard = SetupWizard(self)
         if wizard.exec_():
             # Apply settings from wizard
@@ -390,19 +454,33 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event."""
         # Stop the camera if it's running
-        if self.timer.isActive():
+        if self.camera_worker is not None:
             self.stop_camera()
         
+        # Release the pose model if it was ever loaded
+        if "analyzer" in self.__dict__:
+            self.analyzer.pose_detector.close()
+        
         # Accept the close event
         event.accept()
-
-    def _on_settings_changed(self, key, value):
-        """Handle settings changes."""
-        if key == "camera_id" and self.camera is not None:
-            # Camera ID changed while camera is running
+    
+    def _on_camera_id_changed(self, key, value):
+        """Restart the camera when the camera ID changes while it is running."""
+        if self.camera is not None:
+            self.stop_camera()
+            self.start_camera()
+    
+    def _on_mirror_changed(self, key, value):
+        """Update mirror mode and the mirror button state."""
+        self.mirror_enabled = value
+        self.settings_panel.update_mirror_button(value)
+    
+    def _on_model_complexity_changed(self, key, value):
+        """Rebuild the pose model with the new complexity."""
+        # The analysis thread uses the pose model, so restart the camera around the rebuild
+        if self.camera_worker is not None:
             self.stop_camera()
+            self.analyzer.pose_detector.set_model_complexity(value)
             self.start_camera()
-        elif key == "mirror_enabled":
-            # Update mirror button state
-            self.mirror_enabled = value
-            self.settings_panel.update_mirror_button(value)
+        elif "analyzer" in self.__dict__:
+            self.analyzer.pose_detector.set_model_complexity(value)
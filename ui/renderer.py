@@ -3,13 +3,19 @@ UI rendering for the Bike Fit Analyzer.
 """
 import cv2
 
+from bike_fit_analyzer.config.settings import DISPLAY_WIDTH, DISPLAY_HEIGHT
+
+# Non-blocking key polling, only available in newer OpenCV releases
+_poll_key = getattr(cv2, "pollKey", None)
+
 
 class UIRenderer:
     """Handles UI rendering and user interaction."""
     
-    def __init__(self, window_name="Bike Fit Analyzer"):
+    def __init__(self, window_name="Bike Fit Analyzer", display_size=(DISPLAY_WIDTH, DISPLAY_HEIGHT)):
         """Initialize the UI renderer."""
         self.window_name = window_name
+        self.display_size = display_size
         cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
         self._print_controls()
     
@@ -18,14 +24,25 @@ class UIRenderer:
         print("\nControls:")
         print("- Press 'q' to quit")
         print("- Press 'm' to toggle mirror mode")
+        print("- Press '+'/'-' to change pose model complexity")
         print("- Press 'c' to change camera\n")
     
     def show_frame(self, frame):
-        """Show a frame in the window."""
+        """Show a frame in the window, upscaled to the display size."""
+        height, width = frame.shape[:2]
+        if (width, height) != self.display_size:
+            frame = cv2.resize(frame, self.display_size, interpolation=cv2.INTER_LINEAR)
         cv2.imshow(self.window_name, frame)
     
     def get_key_press(self):
-        """Get key press from the user."""
+        """
+        Get key press from the user.
+        
+        Uses cv2.pollKey (OpenCV 4.5+) when available, which handles GUI events
+        without the 1 ms sleep of cv2.waitKey(1).
+        """
+        if _poll_key is not None:
+            return _poll_key() & 0xFF
         return cv2.waitKey(1) & 0xFF
     
     def cleanup(self):
@@ -49,7 +49,7 @@ class SettingsPanel(QWidget):
         self.connect_signals()
         
         # Register as observer for settings changes
-        settings_manager.add_observer(self._on_settings_changed)
+        settings_manager.add_global_observer(self._on_settings_changed)
     
     def init_ui(self):
         """Initialize the UI components."""
@@ -139,8 +139,8 @@ class SettingsPanel(QWidget):
         ])
         
         # Set default resolution based on settings
-        default_width = settings_manager.get("camera_width", 1280)
-        default_height = settings_manager.get("camera_height", 720)
+        default_width = settings_manager.get("camera_width", 640)
+        default_height = settings_manager.get("camera_height", 480)
         default_resolution = f"{default_width}x{default_height}"
         
         # Find index of default resolution in combo box
@@ -148,8 +148,8 @@ class SettingsPanel(QWidget):
         if index >= 0:
             self.resolution_combo.setCurrentIndex(index)
         else:
-            # Default to 1280x720 if not found
-            index = self.resolution_combo.findText("1280x720")
+            # Default to 640x480 if not found
+            index = self.resolution_combo.findText("640x480")
             if index >= 0:
                 self.resolution_combo.setCurrentIndex(index)
         
@@ -186,7 +186,7 @@ class SettingsPanel(QWidget):
         # Get current settings
         detection_conf = settings_manager.get("min_detection_confidence", 0.5)
         tracking_conf = settings_manager.get("min_tracking_confidence", 0.5)
-        model_complexity = settings_manager.get("pose_model_complexity", 2)
+        model_complexity = settings_manager.get("pose_model_complexity", 1)
         
         # Detection confidence slider
         self.detection_conf_slider = QSlider(Qt.Horizontal)
@@ -823,7 +823,8 @@ class SettingsPanel(QWidget):
             angle_name: Name of the angle
             value: New minimum value
         """
-        current_angles = settings_manager.get("angles", IDEAL_ANGLES.copy())
+        # Copy so set() sees a changed value and notifies observers
+        current_angles = dict(settings_manager.get("angles", IDEAL_ANGLES))
         current_min, current_max = current_angles[angle_name]
         
         # Ensure min <= max
@@ -841,7 +842,8 @@ class SettingsPanel(QWidget):
             angle_name: Name of the angle
             value: New maximum value
         """
-        current_angles = settings_manager.get("angles", IDEAL_ANGLES.copy())
+        # Copy so set() sees a changed value and notifies observers
+        current_angles = dict(settings_manager.get("angles", IDEAL_ANGLES))
         current_min, current_max = current_angles[angle_name]
         
         # Ensure max >= min
@@ -860,7 +862,8 @@ class SettingsPanel(QWidget):
             state: New checkbox state
         """
         enabled = (state == Qt.Checked)
-        angles_enabled = settings_manager.get("angles_enabled", {k: True for k in IDEAL_ANGLES})
+        # Copy so set() sees a changed value and notifies observers
+        angles_enabled = dict(settings_manager.get("angles_enabled", {k: True for k in IDEAL_ANGLES}))
         angles_enabled[angle_name] = enabled
         settings_manager.set("angles_enabled", angles_enabled)
     
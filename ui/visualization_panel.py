@@ -2,7 +2,6 @@
 Enhanced visualization panel for the Bike Fit Analyzer.
 Displays camera output and visualization overlays.
 """
-import cv2
 import numpy as np
 from typing import Optional
 from PyQt5.QtWidgets import (
@@ -12,6 +11,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, pyqtSlot
 from PyQt5.QtGui import QPixmap, QImage
 
+from bike_fit_analyzer.config.settings_manager import settings_manager
+
 
 class VisualizationPanel(QWidget):
     """Panel for displaying camera feed and analysis visualizations."""
@@ -25,11 +26,14 @@ class VisualizationPanel(QWidget):
         self.processed_frame = None
         self.pose_data = None
         self.adjustments = None
+        self.pose_landmarks = None
         
         # Store visualization options
         self.current_view_mode = "Normal View"
         self.show_angles = True
         self.show_guidance = True
+        self.show_landmarks = settings_manager.get("show_landmarks", True)
+        settings_manager.add_observer("show_landmarks", self._on_show_landmarks_changed)
         
         # Initialize UI
         self.init_ui()
@@ -99,7 +103,7 @@ class VisualizationPanel(QWidget):
         self.setMinimumWidth(640)
     
     @pyqtSlot(np.ndarray)
-    def update_frame(self, frame, pose_data=None, adjustments=None):
+    def update_frame(self, frame, pose_data=None, adjustments=None, pose_landmarks=None):
         """
         Update the displayed frame.
         
@@ -107,39 +111,22 @@ class VisualizationPanel(QWidget):
             frame: New frame to display
             pose_data: Optional pose data for visualization
             adjustments: Optional adjustment recommendations
+            pose_landmarks: Optional MediaPipe landmarks for the landmark overlay
         """
         if frame is None:
             return
         
-        # Store the current frame and pose data
-        self.current_frame = frame.copy()
+        # Store the current frame and pose data; every camera read yields a fresh
+        # array and processing below never draws on it, so no copy is needed
+        self.current_frame = frame
         self.pose_data = pose_data
         self.adjustments = adjustments
+        self.pose_landmarks = pose_landmarks
         
         try:
             # Process frame based on visualization options
             self.processed_frame = self._process_frame_with_options(frame)
-            
-            # Convert OpenCV BGR image to RGB for Qt
-            rgb_frame = cv2.cvtColor(self.processed_frame, cv2.COLOR_BGR2RGB)
-            
-            # Convert numpy array to QImage
-            h, w, ch = rgb_frame.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            
-            # Create pixmap and set to label
-            pixmap = QPixmap.fromImage(qt_image)
-            
-            # Scale pixmap to fit the label while maintaining aspect ratio
-            scaled_pixmap = pixmap.scaled(
-                self.image_label.width(),
-                self.image_label.height(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            
-            self.image_label.setPixmap(scaled_pixmap)
+            self._display_frame(self.processed_frame)
             
             # Update guidance text if adjustments are available
             if adjustments:
@@ -147,18 +134,31 @@ class VisualizationPanel(QWidget):
         except Exception as e:
             print(f"Error updating frame: {e}")
             # In case of error, just display the original frame
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_frame.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(qt_image)
-            scaled_pixmap = pixmap.scaled(
-                self.image_label.width(),
-                self.image_label.height(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled_pixmap)
+            self._display_frame(frame)
+    
+    def _display_frame(self, frame):
+        """
+        Show a BGR frame in the image label.
+        
+        Args:
+            frame: BGR frame to display
+        """
+        # Wrap the BGR pixels in a QImage without converting or copying them
+        # (a no-op for the contiguous frames produced by OpenCV)
+        frame = np.ascontiguousarray(frame)
+        h, w = frame.shape[:2]
+        qt_image = QImage(frame.data, w, h, frame.strides[0], QImage.Format_BGR888)
+        
+        # Scale to fit the label while maintaining aspect ratio; the scaled image is
+        # a new buffer, so only the smaller image is copied into the pixmap
+        scaled_image = qt_image.scaled(
+            self.image_label.width(),
+            self.image_label.height(),
+            Qt.KeepAspectRatio,
+            Qt.SmoothTransformation
+        )
+        
+        self.image_label.setPixmap(QPixmap.fromImage(scaled_image))
     
     def _process_frame_with_options(self, frame):
         """
@@ -178,6 +178,11 @@ class VisualizationPanel(QWidget):
         
         processed_frame = frame.copy()
         
+        # Draw the MediaPipe landmark overlay underneath the analysis overlays
+        if self.show_landmarks and self.pose_landmarks is not None:
+            from bike_fit_analyzer.core.pose_detector import draw_pose_landmarks
+            draw_pose_landmarks(processed_frame, self.pose_landmarks)
+        
         # Apply base visualization first
         if self.pose_data is not None:
             # Draw the pose with or without angles
@@ -518,43 +523,33 @@ class VisualizationPanel(QWidget):
     
     def _draw_target_angle_line(self, frame, point_a, point_b, target_angle, current_angle):
         """Draw a line showing the target angle."""
-        import cv2
-        import numpy as np
         import math
         from bike_fit_analyzer.config.settings import COLORS
         
-        # Convert points to numpy arrays
-        a = np.array([point_a.x, point_a.y])
-        b = np.array([point_b.x, point_b.y])
-        
-        # Calculate distance for line length
-        dist = np.linalg.norm(a - b)
+        # Calculate direction vector from b to a, and its length, with scalar math
+        # (NumPy dispatch dominates on 2-element vectors)
+        bx, by = point_b.x, point_b.y
+        dir_x, dir_y = point_a.x - bx, point_a.y - by
+        dist = math.hypot(dir_x, dir_y)
+        if dist == 0:
+            return
         line_length = min(100, dist)
         
-        # Calculate direction vector from b to a
-        dir_vector = a - b
-        dir_vector = dir_vector / np.linalg.norm(dir_vector)
-        
-        # Calculate angle adjustment needed
-        angle_diff = target_angle - current_angle
-        
-        # Rotate the direction vector by the angle difference
-        angle_rad = np.radians(angle_diff)
-        rotation_matrix = np.array([
-            [np.cos(angle_rad), -np.sin(angle_rad)],
-            [np.sin(angle_rad), np.cos(angle_rad)]
-        ])
-        
-        rotated_vector = np.dot(rotation_matrix, dir_vector)
+        # Rotate the unit direction vector by the angle adjustment needed
+        angle_rad = math.radians(target_angle - current_angle)
+        cos_a, sin_a = math.cos(angle_rad), math.sin(angle_rad)
+        rotated_x = (cos_a * dir_x - sin_a * dir_y) / dist
+        rotated_y = (sin_a * dir_x + cos_a * dir_y) / dist
         
         # Calculate target point
-        target_point = b + rotated_vector * line_length
+        target_x = bx + rotated_x * line_length
+        target_y = by + rotated_y * line_length
         
         # Draw dashed line to show target position
         self._draw_dashed_line(
             frame, 
-            (int(b[0]), int(b[1])), 
-            (int(target_point[0]), int(target_point[1])),
+            (bx, by), 
+            (int(target_x), int(target_y)),
             COLORS["highlight"],
             thickness=2,
             dash_length=10,
@@ -638,6 +633,7 @@ class VisualizationPanel(QWidget):
         self.processed_frame = None
         self.pose_data = None
         self.adjustments = None
+        self.pose_landmarks = None
         self.guidance_label.setText("Fit analysis will appear here when analysis is started.")
     
     @pyqtSlot(int)
@@ -657,18 +653,7 @@ class VisualizationPanel(QWidget):
                 processed_frame = self._process_frame_with_options(self.current_frame)
                 
                 # Update display
-                rgb_frame = cv2.cvtColor(processed_frame, cv2.COLOR_BGR2RGB)
-                h, w, ch = rgb_frame.shape
-                bytes_per_line = ch * w
-                qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-                pixmap = QPixmap.fromImage(qt_image)
-                scaled_pixmap = pixmap.scaled(
-                    self.image_label.width(),
-                    self.image_label.height(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                self.image_label.setPixmap(scaled_pixmap)
+                self._display_frame(processed_frame)
             except Exception as e:
                 print(f"Error updating view mode: {e}")
     
@@ -689,18 +674,7 @@ class VisualizationPanel(QWidget):
                 processed_frame = self._process_frame_with_options(self.current_frame)
                 
                 # Update display
-                rgb_frame = cv2.cvtColor(processed_frame, cv2.COLOR_BGR2RGB)
-                h, w, ch = rgb_frame.shape
-                bytes_per_line = ch * w
-                qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-                pixmap = QPixmap.fromImage(qt_image)
-                scaled_pixmap = pixmap.scaled(
-                    self.image_label.width(),
-                    self.image_label.height(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                self.image_label.setPixmap(scaled_pixmap)
+                self._display_frame(processed_frame)
             except Exception as e:
                 print(f"Error toggling angles: {e}")
     
@@ -721,21 +695,14 @@ class VisualizationPanel(QWidget):
                 processed_frame = self._process_frame_with_options(self.current_frame)
                 
                 # Update display
-                rgb_frame = cv2.cvtColor(processed_frame, cv2.COLOR_BGR2RGB)
-                h, w, ch = rgb_frame.shape
-                bytes_per_line = ch * w
-                qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-                pixmap = QPixmap.fromImage(qt_image)
-                scaled_pixmap = pixmap.scaled(
-                    self.image_label.width(),
-                    self.image_label.height(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                self.image_label.setPixmap(scaled_pixmap)
+                self._display_frame(processed_frame)
             except Exception as e:
                 print(f"Error toggling guidance: {e}")
     
+    def _on_show_landmarks_changed(self, key, value):
+        """Show or hide the landmark overlay."""
+        self.show_landmarks = value
+    
     def update_guidance_text(self, guidance_text):
         """
         Update the guidance text.
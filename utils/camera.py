@@ -1,65 +1,130 @@
 """
 Camera handling utilities for the Bike Fit Analyzer.
 """
+import glob
 import os
+import platform
 import cv2
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import Dict, List, Optional, Tuple
 
+# Whether we are running on macOS, evaluated once at import
+IS_MACOS = os.name == 'posix' and platform.system() == 'Darwin'
+
 
 class CameraManager:
     """Handles camera detection, selection, and management."""
     
-    def __init__(self):
-        """Initialize the camera manager."""
-        self.available_cameras = self.find_available_cameras()
+    # Number of device indices probed when searching for cameras
+    MAX_CAMERAS = 10
+    
+    @cached_property
+    def available_cameras(self) -> Dict[int, str]:
+        """Available camera devices, probed on first access."""
+        return self.find_available_cameras()
+    
+    def _probe_camera(self, index: int, api_preference: Optional[int] = None) -> Optional[str]:
+        """
+        Try to open a camera and read a frame from it.
+        
+        Args:
+            index: Camera device index
+            api_preference: Optional OpenCV capture backend
+            
+        Returns:
+            Backend name of the camera if it delivered a frame, otherwise None
+        """
+        if api_preference is None:
+            cap = cv2.VideoCapture(index)
+        else:
+            cap = cv2.VideoCapture(index, api_preference)
+        
+        try:
+            if not cap.isOpened():
+                return None
+            ret, frame = cap.read()
+            if not ret:
+                return None
+            
+            # On some systems, we can get the camera name
+            try:
+                return cap.getBackendName()
+            except:
+                return "Camera"
+        finally:
+            cap.release()
+    
+    def _video_devices(self) -> Dict[int, str]:
+        """
+        List the /dev/video* device nodes with a single directory scan.
+        
+        Returns:
+            Dictionary mapping device index to device path
+        """
+        devices = {}
+        for path in glob.glob("/dev/video*"):
+            suffix = path.rsplit("video", 1)[1]
+            if suffix.isdigit() and int(suffix) < self.MAX_CAMERAS:
+                devices[int(suffix)] = path
+        return devices
+    
+    def _probe_cameras(self, indices: Optional[List[int]] = None,
+                       api_preference: Optional[int] = None) -> Dict[int, Optional[str]]:
+        """
+        Probe camera indices in parallel.
+        
+        Opening a capture device can take hundreds of milliseconds, so the
+        probes run concurrently instead of one after another.
+        
+        Args:
+            indices: Camera indices to probe (defaults to all MAX_CAMERAS indices)
+            api_preference: Optional OpenCV capture backend
+            
+        Returns:
+            Dictionary mapping camera ID to its probe result
+        """
+        if indices is None:
+            indices = list(range(self.MAX_CAMERAS))
+        if not indices:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=len(indices)) as executor:
+            return dict(zip(indices, executor.map(
+                lambda i: self._probe_camera(i, api_preference),
+                indices
+            )))
     
     def find_available_cameras(self) -> Dict[int, str]:
         """Find all available camera devices."""
         available_cameras = {}
         
+        # Where video device nodes exist, only probe the indices that are present
+        devices = self._video_devices()
+        probe_results = self._probe_cameras(sorted(devices) or None)
+        
         # On macOS, check for specific camera devices
-        if os.name == 'posix' and os.uname().sysname == 'Darwin':  # Check if running on macOS
+        if IS_MACOS:
             # Check for common macOS camera paths
-            for i in range(10):  # Check devices 0-9
-                # Check potential FaceTime HD Camera
-                facetime_path = f"/dev/video{i}"
-                if os.path.exists(facetime_path):
-                    available_cameras[i] = f"Camera at {facetime_path}"
-                
-                # Also try to open the camera to verify it works
-                cap = cv2.VideoCapture(i)
-                if cap.isOpened():
-                    ret, frame = cap.read()
-                    if ret:
-                        available_cameras[i] = f"Camera #{i}"
-                    cap.release()
+            for i, device_path in devices.items():
+                available_cameras[i] = f"Camera at {device_path}"
+            
+            # Also use the probe to verify it works
+            for i, backend_name in probe_results.items():
+                if backend_name is not None:
+                    available_cameras[i] = f"Camera #{i}"
         else:
             # Generic approach for other platforms
-            for i in range(10):  # Check devices 0-9
-                cap = cv2.VideoCapture(i)
-                if cap.isOpened():
-                    ret, frame = cap.read()
-                    if ret:
-                        # Try to get camera name
-                        camera_name = f"Camera #{i}"
-                        # On some systems, we can get the camera name
-                        try:
-                            camera_name = cap.getBackendName() + f" #{i}"
-                        except:
-                            pass
-                        available_cameras[i] = camera_name
-                    cap.release()
+            for i, backend_name in probe_results.items():
+                if backend_name is not None:
+                    available_cameras[i] = f"{backend_name} #{i}"
         
         # Special handling for MacBook - if no cameras found via indices,
         # try using cv2.CAP_AVFOUNDATION explicitly for macOS
-        if os.name == 'posix' and os.uname().sysname == 'Darwin' and len(available_cameras) == 0:
-            for i in range(10):
-                cap = cv2.VideoCapture(i, cv2.CAP_AVFOUNDATION)
-                if cap.isOpened():
-                    ret, frame = cap.read()
-                    if ret:
-                        available_cameras[i] = f"AVFoundation Camera #{i}"
-                    cap.release()
+        if IS_MACOS and len(available_cameras) == 0:
+            for i, backend_name in self._probe_cameras(api_preference=cv2.CAP_AVFOUNDATION).items():
+                if backend_name is not None:
+                    available_cameras[i] = f"AVFoundation Camera #{i}"
         
         return available_cameras
 
@@ -100,15 +165,26 @@ class CameraManager:
             except ValueError:
                 print("Please enter a valid number.")
 
-    def open_camera(self, camera_id: int) -> Optional[cv2.VideoCapture]:
-        """Open the camera with the specified ID."""
+    def open_camera(self, camera_id: int, width: Optional[int] = None,
+                    height: Optional[int] = None) -> Optional[cv2.VideoCapture]:
+        """
+        Open the camera with the specified ID.
+        
+        Args:
+            camera_id: Camera device index
+            width: Capture width (defaults to CAMERA_WIDTH)
+            height: Capture height (defaults to CAMERA_HEIGHT)
+            
+        Returns:
+            Opened capture, or None if the camera could not be opened
+        """
         print(f"Opening camera {camera_id}...")
         
         # Try standard method first
         cap = cv2.VideoCapture(camera_id)
         
         # If that doesn't work and we're on macOS, try AVFoundation backend
-        if not cap.isOpened() and os.name == 'posix' and os.uname().sysname == 'Darwin':
+        if not cap.isOpened() and IS_MACOS:
             print("Trying AVFoundation backend for macOS...")
             cap = cv2.VideoCapture(camera_id, cv2.CAP_AVFOUNDATION)
         
@@ -119,7 +195,12 @@ class CameraManager:
         
         # Set camera resolution
         from bike_fit_analyzer.config.settings import CAMERA_WIDTH, CAMERA_HEIGHT
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
+        # MJPG lets USB cameras deliver full frame rate at capture resolutions
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width or CAMERA_WIDTH)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height or CAMERA_HEIGHT)
+        # Keep only the newest frame in the driver queue so reads return fresh frames
+        # (ignored by backends that do not support it)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         
         return cap
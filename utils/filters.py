@@ -0,0 +1,70 @@
+"""
+Signal filtering utilities for the Bike Fit Analyzer.
+"""
+import math
+import numpy as np
+from typing import Optional
+
+
+class OneEuroFilter:
+    """
+    One Euro filter applied element-wise to an array of coordinates.
+    
+    Smooths strongly while landmarks move slowly, removing jitter, and lowers
+    the smoothing as they speed up so fast movements are not lagged.
+    """
+    
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.007, d_cutoff: float = 1.0):
+        """
+        Initialize the filter.
+        
+        Args:
+            min_cutoff: Minimum cutoff frequency in Hz (lower = smoother at rest)
+            beta: Speed coefficient (higher = less lag during fast movement)
+            d_cutoff: Cutoff frequency in Hz for the derivative estimate
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+    
+    def reset(self):
+        """Forget the filter state, e.g. after the tracked pose was lost."""
+        self._x: Optional[np.ndarray] = None
+        self._dx: Optional[np.ndarray] = None
+        self._t = 0.0
+    
+    @staticmethod
+    def _alpha(dt: float, cutoff):
+        """Smoothing factor of a first-order low-pass filter."""
+        tau = 1.0 / (2.0 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+    
+    def __call__(self, x: np.ndarray, t: float) -> np.ndarray:
+        """
+        Filter a new sample.
+        
+        Args:
+            x: Sample array (any shape, constant between calls)
+            t: Sample timestamp in seconds
+        
+        Returns:
+            Filtered array, owned by the filter and updated by the next call
+        """
+        if self._x is None or self._x.shape != x.shape:
+            self._x = np.array(x, dtype=np.float32)
+            self._dx = np.zeros_like(self._x)
+            self._t = t
+            return self._x
+        
+        dt = t - self._t
+        if dt <= 0.0:
+            return self._x
+        self._t = t
+        
+        # Low-pass the speed, then adapt the cutoff to it
+        self._dx += self._alpha(dt, self.d_cutoff) * ((x - self._x) / dt - self._dx)
+        cutoff = self.min_cutoff + self.beta * np.abs(self._dx)
+        self._x += self._alpha(dt, cutoff) * (x - self._x)
+        
+        return self._x
@@ -2,6 +2,7 @@
 Visualization utilities for the Bike Fit Analyzer.
 """
 import cv2
+import math
 import numpy as np
 import time
 from typing import Tuple, Dict, List, Optional
@@ -10,6 +11,55 @@ from bike_fit_analyzer.models.angles import Point, Angle, PoseData
 from bike_fit_analyzer.config.settings import (
     IDEAL_ANGLES, COLORS, FONT, LINE_THICKNESS, POINT_RADIUS
 )
+from bike_fit_analyzer.utils.jit import njit
+
+# Seconds between refreshes of the displayed FPS value
+FPS_UPDATE_INTERVAL = 0.5
+
+# Skeleton connections as chains of landmarks (head and arm, torso and leg)
+SKELETON_CHAINS = (
+    ("nose", "shoulder", "elbow", "wrist"),
+    ("shoulder", "hip", "knee", "ankle")
+)
+SKELETON_ROWS = tuple(
+    np.array([PoseData.LANDMARK_INDEX[name] for name in chain], dtype=np.intp)
+    for chain in SKELETON_CHAINS
+)
+
+
+@njit(cache=True, fastmath=True)
+def _arc_params(ax: float, ay: float, bx: float, by: float, cx: float, cy: float):
+    """
+    Calculate the arc geometry used to visualize the angle at vertex (bx, by).
+    
+    Returns:
+        Tuple of (radius, start angle, end angle, text x, text y)
+    """
+    # Calculate radius based on distance
+    radius = int(math.sqrt((bx - ax) ** 2 + (by - ay) ** 2) * 0.3)
+    
+    # Calculate angles for arc
+    angle1 = math.atan2(ay - by, ax - bx) * 180.0 / math.pi
+    angle2 = math.atan2(cy - by, cx - bx) * 180.0 / math.pi
+    
+    # Ensure angles are in the proper range
+    start_angle = (min(angle1, angle2) + 360.0) % 360.0
+    end_angle = (max(angle1, angle2) + 360.0) % 360.0
+    
+    # Swap if we need to draw the minor arc
+    if end_angle - start_angle > 180.0:
+        start_angle, end_angle = end_angle, start_angle + 360.0
+    
+    # Place the label just outside the middle of the arc
+    mid_angle = math.radians((start_angle + end_angle) / 2)
+    text_x = int(bx + 1.2 * radius * math.cos(mid_angle))
+    text_y = int(by + 1.2 * radius * math.sin(mid_angle))
+    
+    return radius, start_angle, end_angle, text_x, text_y
+
+
+# Compile the kernel at import time so the first drawn frame does not pay the JIT cost
+_arc_params(0.0, 1.0, 0.0, 0.0, 1.0, 0.0)
 
 
 class Visualizer:
@@ -19,14 +69,58 @@ class Visualizer:
         """Initialize the visualizer."""
         self.prev_time = 0
         self.current_time = 0
+        
+        # Colors used on every frame, bound once to avoid repeated dict lookups
+        self._c_in = COLORS["in_range"]
+        self._c_out = COLORS["out_of_range"]
+        self._c_text = COLORS["text_color"]
+        self._c_hi = COLORS["highlight"]
+        self._c_line = COLORS["line_color"]
+        
+        # Smoothed FPS, with the displayed text refreshed only periodically
+        self._fps_ema = 0.0
+        self._fps_text = "FPS: 0"
+        self._fps_last_update = 0.0
+        
+        # Ideal ranges as parallel bound arrays for a single vectorized range check;
+        # the extra last slot is an empty range for angle types without an ideal range
+        angle_types = list(IDEAL_ANGLES)
+        self._angle_idx = {angle_type: i for i, angle_type in enumerate(angle_types)}
+        self._amin = np.array([IDEAL_ANGLES[t][0] for t in angle_types] + [np.inf], dtype=np.float64)
+        self._amax = np.array([IDEAL_ANGLES[t][1] for t in angle_types] + [-np.inf], dtype=np.float64)
+        
+        # Ideal angle reference labels never change, so build them once
+        y_offset = 30
+        self._angle_labels = [
+            (f"{angle_type.replace('_', ' ').title()}: {min_val}deg-{max_val}deg", (10, y_offset + i * 30))
+            for i, (angle_type, (min_val, max_val)) in enumerate(IDEAL_ANGLES.items())
+        ]
     
     def get_color(self, angle: Angle) -> Tuple[int, int, int]:
         """Get color based on whether angle is in ideal range."""
         if angle.is_in_range(IDEAL_ANGLES):
-            return COLORS["in_range"]
-        return COLORS["out_of_range"]
+            return self._c_in
+        return self._c_out
     
-    def draw_angle_arc(self, image: np.ndarray, angle: Angle, show_value: bool = True) -> None:
+    def get_colors(self, angles: List[Angle]) -> List[Tuple[int, int, int]]:
+        """
+        Get the colors of several angles with one vectorized range check.
+        
+        Args:
+            angles: Angles to color
+            
+        Returns:
+            Color of each angle, in the same order
+        """
+        no_range = len(self._angle_idx)
+        rows = [self._angle_idx.get(angle.angle_type, no_range) for angle in angles]
+        values = np.fromiter((angle.value for angle in angles), dtype=np.float64, count=len(angles))
+        in_range = (values >= self._amin[rows]) & (values <= self._amax[rows])
+        
+        return [self._c_in if ok else self._c_out for ok in in_range.tolist()]
+    
+    def draw_angle_arc(self, image: np.ndarray, angle: Angle, show_value: bool = True,
+                       color: Optional[Tuple[int, int, int]] = None) -> None:
         """
         Draw an arc to visualize the angle.
         
@@ -34,46 +128,32 @@ class Visualizer:
             image: Image to draw on
             angle: Angle to visualize
             show_value: Whether to show the angle value
+            color: Precomputed arc color; derived from the ideal range if omitted
         """
         point_a = angle.point_a.as_tuple()
         point_b = angle.point_b.as_tuple()
         point_c = angle.point_c.as_tuple()
         
-        # Calculate radius based on distance
-        radius = int(np.linalg.norm(np.array(point_b) - np.array(point_a)) * 0.3)
-        
-        # Calculate angles for arc
-        vector1 = np.array([point_a[0] - point_b[0], point_a[1] - point_b[1]])
-        vector2 = np.array([point_c[0] - point_b[0], point_c[1] - point_b[1]])
-        
-        angle1 = np.arctan2(vector1[1], vector1[0]) * 180 / np.pi
-        angle2 = np.arctan2(vector2[1], vector2[0]) * 180 / np.pi
-        
-        # Ensure angles are in the proper range
-        start_angle = (min(angle1, angle2) + 360) % 360
-        end_angle = (max(angle1, angle2) + 360) % 360
-        
-        # Swap if we need to draw the minor arc
-        if end_angle - start_angle > 180:
-            start_angle, end_angle = end_angle, start_angle + 360
+        # Calculate arc geometry and label position
+        radius, start_angle, end_angle, text_x, text_y = _arc_params(
+            float(point_a[0]), float(point_a[1]),
+            float(point_b[0]), float(point_b[1]),
+            float(point_c[0]), float(point_c[1])
+        )
             
-        color = self.get_color(angle)
+        if color is None:
+            color = self.get_color(angle)
             
         # Draw the arc
         cv2.ellipse(image, point_b, (radius, radius), 0, start_angle, end_angle, color, 2)
         
         # Position for the text
         if show_value:
-            text_offset_x = radius * np.cos(np.radians((start_angle + end_angle) / 2))
-            text_offset_y = radius * np.sin(np.radians((start_angle + end_angle) / 2))
-            text_position = (
-                int(point_b[0] + 1.2 * text_offset_x), 
-                int(point_b[1] + 1.2 * text_offset_y)
-            )
+            text_position = (text_x, text_y)
             
             # Add the angle text
             cv2.putText(
-             image, f"{angle.value:.1f} deg", text_position, FONT, 0.6, COLORS["text_color"], 2
+             image, f"{angle.value:.1f} deg", text_position, FONT, 0.6, self._c_text, 2
             )
     
     def draw_pose(self, frame: np.ndarray, pose_data: PoseData, show_angles: bool = True) -> np.ndarray:
@@ -95,31 +175,23 @@ class Visualizer:
         
         # Draw key points
         for point in pose_data.landmarks.values():
-            cv2.circle(result_frame, point.as_tuple(), POINT_RADIUS, COLORS["highlight"], -1)
-        
-        # Draw connecting lines
-        connections = [
-            (pose_data.landmarks["nose"], pose_data.landmarks["shoulder"]),
-            (pose_data.landmarks["shoulder"], pose_data.landmarks["elbow"]),
-            (pose_data.landmarks["elbow"], pose_data.landmarks["wrist"]),
-            (pose_data.landmarks["shoulder"], pose_data.landmarks["hip"]),
-            (pose_data.landmarks["hip"], pose_data.landmarks["knee"]),
-            (pose_data.landmarks["knee"], pose_data.landmarks["ankle"])
-        ]
+            cv2.circle(result_frame, point.as_tuple(), POINT_RADIUS, self._c_hi, -1)
         
-        for start_point, end_point in connections:
-            cv2.line(
-                result_frame, 
-                start_point.as_tuple(), 
-                end_point.as_tuple(), 
-                COLORS["line_color"], 
-                LINE_THICKNESS
-            )
+        # Draw connecting lines as open polylines in a single call
+        if pose_data.landmarks_xy is not None:
+            skeleton = [pose_data.landmarks_xy[rows] for rows in SKELETON_ROWS]
+        else:
+            skeleton = [
+                np.array([pose_data.landmarks[name].as_tuple() for name in chain], dtype=np.int32)
+                for chain in SKELETON_CHAINS
+            ]
+        cv2.polylines(result_frame, skeleton, False, self._c_line, LINE_THICKNESS)
         
         # Draw angles with arcs
-        if show_angles:
-            for angle in pose_data.angles.values():
-                self.draw_angle_arc(result_frame, angle)
+        if show_angles and pose_data.angles:
+            angles = list(pose_data.angles.values())
+            for angle, color in zip(angles, self.get_colors(angles)):
+                self.draw_angle_arc(result_frame, angle, color=color)
         
         return result_frame
     
@@ -136,31 +208,36 @@ class Visualizer:
         result_frame = frame.copy()
         
         # Add ideal angle ranges as reference
-        y_offset = 30
-        for i, (angle_type, (min_val, max_val)) in enumerate(IDEAL_ANGLES.items()):
-            text = f"{angle_type.replace('_', ' ').title()}: {min_val}deg-{max_val}deg"
+        for text, position in self._angle_labels:
             cv2.putText(
                 result_frame, 
                 text, 
-                (10, y_offset + i * 30), 
+                position, 
                 FONT, 
                 0.6, 
-                COLORS["text_color"], 
+                self._c_text, 
                 2
             )
         
         # Calculate and display FPS
         self.current_time = time.time()
-        fps = 1 / (self.current_time - self.prev_time) if (self.current_time - self.prev_time) > 0 else 0
+        dt = self.current_time - self.prev_time
+        fps = 1 / dt if dt > 0 else 0
         self.prev_time = self.current_time
         
+        # Smooth with an exponential moving average and refresh the text twice per second
+        self._fps_ema = 0.9 * self._fps_ema + 0.1 * fps
+        if self.current_time - self._fps_last_update > FPS_UPDATE_INTERVAL:
+            self._fps_text = f"FPS: {int(self._fps_ema)}"
+            self._fps_last_update = self.current_time
+        
         cv2.putText(
             result_frame, 
-            f"FPS: {int(fps)}", 
+            self._fps_text, 
             (10, frame.shape[0] - 10), 
             FONT, 
             0.7, 
-            COLORS["text_color"], 
+            self._c_text, 
             2
         )
         